@@ -0,0 +1,386 @@
+import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
+import cv2
+
+from dino.detect import (
+    LOOK_H,
+    LOOK_W,
+    LOOK_X_REL,
+    LOOK_Y_OFF,
+    STRIP_H,
+    STRIP_W,
+    STRIP_X_REL,
+    STRIP_Y_OFF,
+    get_roi,
+)
+from dino.sprites import FRAME_H, FRAME_W, GROUND_Y, draw_frame, stamp
+from dino.strategies import build_detector
+
+# =============================================================================
+# Golden-frame corpus + accuracy/speed regression gate for the obstacle detectors.
+#
+#   python detect-bench.py                   # score every detector, gate vs baseline
+#   python detect-bench.py --update-baseline # re-record accuracy + budgets after an intended change
+#   python detect-bench.py --dump golden/    # write the corpus as PNG + labels.json
+#   python detect-bench.py --corpus golden/  # score a (possibly hand-labelled) PNG corpus
+#
+# Exit code is 1 when any detector gets less accurate than the baseline or when its
+# per-frame time grows beyond its budget: BUDGET_SLACK x the time measured when the
+# baseline was recorded (us_measured), so each detector is held to its own speed.
+# =============================================================================
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(HERE, "detect-baseline.json")
+
+# ----------------- GATE -----------------
+EDGE_TOL_PX = 0.5  # allowed growth of mean edge error before failing
+BUDGET_SLACK = 2.0  # us/frame budget = recorded us/frame x this (timing noise headroom)
+REPS = 200  # timed detector calls per frame
+
+# The gate has to run without a display (CI): building the detectors must not pull these in
+GUI_MODULES = ("pyautogui", "mss")
+
+# Each scene: night flag + list of blocks; a block is a list of (sprite, x[, bottom_y]).
+# Blocks are the ground truth: a cactus "forest" is one block, whatever its inner gaps.
+SCENES = [
+    ("empty", False, []),
+    ("small_far", False, [[("small", 300)]]),
+    ("small_near_trigger", False, [[("small", 150)]]),
+    ("large_mid", False, [[("large", 220)]]),
+    ("large_entering_right", False, [[("large", 495)]]),
+    ("forest_small_x3", False, [[("small", 180), ("small", 196), ("small", 212)]]),
+    ("forest_mixed", False, [[("large", 260), ("small", 282), ("large", 297)]]),
+    ("forest_loose", False, [[("small", 200), ("small", 220), ("small", 240)]]),
+    ("two_blocks", False, [[("small", 140)], [("large", 380)]]),
+    ("small_leaving_left", False, [[("small", 48)]]),
+    ("bird_low", False, [[("bird", 250, GROUND_Y)]]),
+    ("bird_mid", False, [[("bird", 200, 90)]]),
+    ("bird_high", False, [[("bird", 200, 50)]]),
+    ("bird_high_then_small", False, [[("bird", 160, 50)], [("small", 400)]]),
+    ("night_small", True, [[("small", 240)]]),
+    ("night_forest", True, [[("small", 160), ("large", 175), ("small", 196)]]),
+    ("night_large_far", True, [[("large", 330)]]),
+    ("night_bird_low", True, [[("bird", 120, GROUND_Y)]]),
+    # Separate blocks 4-6 px apart near the trigger line: the gap closing must not merge them
+    ("pair_gap5_near_trigger", False, [[("small", 120)], [("small", 140)]]),
+    ("pair_gap4_at_trigger", False, [[("large", 129)], [("small", 155)]]),
+    ("pair_gap6_passing", False, [[("small", 36)], [("small", 58)]]),
+    ("large_leaving_left", False, [[("large", 37)]]),
+    ("night_pair_gap5", True, [[("small", 102)], [("small", 121)]]),
+]
+
+
+def _stamp_blocks(mask, blocks):
+    for block in blocks:
+        for item in block:
+            sprite, x = item[0], item[1]
+            bottom_y = item[2] if len(item) > 2 else GROUND_Y
+            stamp(mask, sprite, x, bottom_y)
+
+
+def render_scene(night, blocks):
+    """
+    Returns (frame_bgr, obstacle_mask). The mask only holds obstacle pixels
+    (no dino, clouds, ground or score) and is used to derive ground truth.
+    """
+    obstacle = np.zeros((FRAME_H, FRAME_W), bool)
+    _stamp_blocks(obstacle, blocks)
+    return draw_frame(obstacle, night), obstacle
+
+
+def block_truth(obstacle, blocks, roi):
+    """
+    Ground-truth (lead_x, trail_x) of the first block whose pixels fall in the ROI,
+    or None. Edges are clipped to the ROI, like the detectors see them.
+    """
+    x1, y1, x2, y2 = roi
+    edges = []
+    for block in blocks:
+        m = np.zeros_like(obstacle)
+        _stamp_blocks(m, [block])
+        cols = np.flatnonzero((m & obstacle)[y1:y2, x1:x2].any(axis=0))
+        if cols.size:
+            edges.append((x1 + int(cols[0]), x1 + int(cols[-1])))
+    return min(edges) if edges else None
+
+
+def build_corpus():
+    corpus = []
+    for name, night, blocks in SCENES:
+        frame, obstacle = render_scene(night, blocks)
+        corpus.append(
+            {
+                "name": name,
+                "night": night,
+                "frame": frame,
+                "obstacle": obstacle,
+                "blocks": blocks,
+            }
+        )
+    return corpus
+
+
+def dump_corpus(corpus, out_dir, roi, strip):
+    os.makedirs(out_dir, exist_ok=True)
+    labels = []
+    for item in corpus:
+        cv2.imwrite(os.path.join(out_dir, item["name"] + ".png"), item["frame"])
+        truth = block_truth(item["obstacle"], item["blocks"], roi)
+        sx1, sy1, sx2, sy2 = strip
+        labels.append(
+            {
+                "name": item["name"],
+                "night": item["night"],
+                "block": list(truth) if truth is not None else None,
+                "strip_hit": bool(item["obstacle"][sy1:sy2, sx1:sx2].any()),
+            }
+        )
+    with open(os.path.join(out_dir, "labels.json"), "w") as f:
+        json.dump(labels, f, indent=2)
+
+
+def load_corpus(in_dir):
+    """Loads PNG frames + labels.json (same schema as --dump writes)."""
+    with open(os.path.join(in_dir, "labels.json")) as f:
+        labels = json.load(f)
+    corpus = []
+    for lab in labels:
+        frame = cv2.imread(os.path.join(in_dir, lab["name"] + ".png"), cv2.IMREAD_COLOR)
+        if frame is None:
+            raise FileNotFoundError(lab["name"] + ".png")
+        corpus.append(
+            {
+                "name": lab["name"],
+                "night": lab["night"],
+                "frame": frame,
+                "truth": tuple(lab["block"]) if lab["block"] is not None else None,
+                "strip_hit": lab["strip_hit"],
+            }
+        )
+    return corpus
+
+
+# =============================================================================
+# DETECTOR VARIANTS
+# =============================================================================
+def block_detector(name):
+    det = build_detector(name)
+
+    def detect(frame, night):
+        det.invert = night
+        obs = det(frame)
+        return None if obs is None else (obs["lead_x"], obs["trail_x"])
+
+    return detect
+
+
+def strip_detector():
+    det = build_detector("strip")
+
+    def detect(frame, night):
+        return det(frame)["hit"]
+
+    return detect
+
+
+def load_detectors():
+    """strategy -> (kind, detect_fn, roi) for every detector variant in the repo."""
+    blank = np.zeros((FRAME_H, FRAME_W, 3), np.uint8)
+    detectors = {
+        "strip": (
+            "hit",
+            strip_detector(),
+            get_roi(blank, STRIP_X_REL, STRIP_W, STRIP_Y_OFF, STRIP_H)[1],
+        )
+    }
+    roi = get_roi(blank, LOOK_X_REL, LOOK_W, LOOK_Y_OFF, LOOK_H)[1]
+    for name in ("better", "even-better"):
+        detectors[name] = ("block", block_detector(name), roi)
+    return detectors
+
+
+# =============================================================================
+# SCORING
+# =============================================================================
+def truth_for(item, kind, roi):
+    if kind == "hit":
+        if "strip_hit" in item:
+            return item["strip_hit"]
+        x1, y1, x2, y2 = roi
+        return bool(item["obstacle"][y1:y2, x1:x2].any())
+    if "truth" in item:
+        return item["truth"]
+    return block_truth(item["obstacle"], item["blocks"], roi)
+
+
+def score(kind, detect, roi, corpus, reps):
+    misses = 0
+    false_pos = 0
+    edge_errs = []
+    per_frame = []
+
+    for item in corpus:
+        truth = truth_for(item, kind, roi)
+        got = detect(item["frame"], item["night"])
+
+        if kind == "hit":
+            misses += int(truth and not got)
+            false_pos += int(got and not truth)
+        elif truth is None:
+            false_pos += int(got is not None)
+        elif got is None:
+            misses += 1
+        else:
+            err = abs(got[0] - truth[0]) + abs(got[1] - truth[1])
+            edge_errs.append(err)
+            per_frame.append((item["name"], got, truth, err))
+
+    # Timing: `reps` passes over the corpus, interleaved the way frames arrive in a
+    # run; the fastest pass counts (the others mostly measure the scheduler)
+    frames = [(item["frame"], item["night"]) for item in corpus]
+    best = float("inf")
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        for frame, night in frames:
+            detect(frame, night)
+        best = min(best, time.perf_counter() - t0)
+    us = best * 1e6 / len(frames)
+
+    return {
+        "frames": len(corpus),
+        "misses": misses,
+        "false_pos": false_pos,
+        "mean_edge_err": float(np.mean(edge_errs)) if edge_errs else 0.0,
+        "max_edge_err": int(max(edge_errs)) if edge_errs else 0,
+        "us_per_frame": us,
+        "edges": per_frame,
+    }
+
+
+def gate(name, result, base):
+    """Returns a list of failure strings (empty = pass)."""
+    if base is None:
+        return [f"{name}: no baseline (run with --update-baseline)"]
+    fails = []
+    if result["misses"] > base["misses"]:
+        fails.append(f"{name}: misses {result['misses']} > {base['misses']}")
+    if result["false_pos"] > base["false_pos"]:
+        fails.append(f"{name}: false_pos {result['false_pos']} > {base['false_pos']}")
+    if result["mean_edge_err"] > base["mean_edge_err"] + EDGE_TOL_PX:
+        fails.append(
+            f"{name}: mean_edge_err {result['mean_edge_err']:.2f}"
+            f" > {base['mean_edge_err']:.2f} + {EDGE_TOL_PX}"
+        )
+    if result["max_edge_err"] > base["max_edge_err"]:
+        fails.append(
+            f"{name}: max_edge_err {result['max_edge_err']} > {base['max_edge_err']}"
+        )
+    if result["us_per_frame"] > base["us_budget"]:
+        fails.append(
+            f"{name}: {result['us_per_frame']:.1f} us/frame > budget {base['us_budget']:.1f}"
+        )
+    return fails
+
+
+def main():
+    p = argparse.ArgumentParser(description="Dino detector accuracy + speed gate")
+    p.add_argument("--corpus", help="Directory with PNG frames + labels.json")
+    p.add_argument("--dump", help="Write the built-in corpus to this directory and exit")
+    p.add_argument("--reps", type=int, default=REPS, help="Timed calls per frame")
+    p.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record current accuracy and us/frame (x BUDGET_SLACK = budget) as the baseline",
+    )
+    p.add_argument(
+        "--keep-budgets",
+        action="store_true",
+        help="With --update-baseline: only re-record accuracy, keep the recorded budgets",
+    )
+    p.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply every us/frame budget (slow CI machines)",
+    )
+    p.add_argument("-v", "--verbose", action="store_true", help="Per-frame edge errors")
+    args = p.parse_args()
+
+    try:
+        detectors = load_detectors()
+    except ImportError as e:
+        print(f"FAIL detectors can't be built here: {e}")
+        return 1
+    gui = [m for m in GUI_MODULES if m in sys.modules]
+    if gui:
+        print(f"FAIL building the detectors imported {', '.join(gui)} (gate must run headless)")
+        return 1
+
+    if args.dump:
+        block_roi = detectors["better"][2]
+        strip_roi = detectors["strip"][2]
+        dump_corpus(build_corpus(), args.dump, block_roi, strip_roi)
+        print(f"wrote {len(SCENES)} frames to {args.dump}")
+        return 0
+
+    corpus = load_corpus(args.corpus) if args.corpus else build_corpus()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+    fails = []
+    print(
+        f"{'detector':<26} {'miss':>4} {'fp':>4} {'mean_err':>8} {'max_err':>7}"
+        f" {'us/frame':>9} {'budget':>8}"
+    )
+    for name, (kind, detect, roi) in detectors.items():
+        res = score(kind, detect, roi, corpus, args.reps)
+        base = baseline.get(name)
+        budget = base["us_budget"] * args.budget_scale if base else float("nan")
+        print(
+            f"{name:<26} {res['misses']:>4} {res['false_pos']:>4}"
+            f" {res['mean_edge_err']:>8.2f} {res['max_edge_err']:>7}"
+            f" {res['us_per_frame']:>9.1f} {budget:>8.1f}"
+        )
+        if args.verbose:
+            for frame_name, got, truth, err in res["edges"]:
+                print(f"    {frame_name:<22} got={got} truth={truth} err={err}")
+
+        if args.update_baseline:
+            us = res["us_per_frame"]
+            if args.keep_budgets and base:
+                us = base["us_measured"]
+            baseline[name] = {
+                "misses": res["misses"],
+                "false_pos": res["false_pos"],
+                "mean_edge_err": round(res["mean_edge_err"], 3),
+                "max_edge_err": res["max_edge_err"],
+                "us_measured": round(us, 1),
+                "us_budget": round(us * BUDGET_SLACK, 1),
+            }
+        else:
+            if base is not None:
+                base = dict(base, us_budget=budget)
+            fails += gate(name, res, base)
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {BASELINE_PATH}")
+        return 0
+
+    for msg in fails:
+        print("FAIL", msg)
+    print("FAIL" if fails else "OK")
+    return 1 if fails else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+"""
+Chrome dino bot engine: capture -> detect -> policy -> actuate -> render.
+
+Stages live in their own modules and pull in cv2 / mss / pyautogui only when
+they are built, so importing the package (e.g. for benchmarks) is cheap.
+Run it with `python -m dino --strategy {strip,better,even-better}`.
+"""
+
+from .strategies import STRATEGIES
+
+__all__ = ["STRATEGIES"]
@@ -0,0 +1,43 @@
+import time
+
+# ----------------- INPUT -----------------
+JUMP_KEY = "space"
+DROP_KEY = "down"
+KEY_PAUSE_S = 0.1  # pyautogui.PAUSE default: every key call blocks this long after its event
+
+
+class PyAutoGuiActuator:
+    """Real key presses. pyautogui (and its display connection) is only loaded when this is built."""
+
+    def __init__(self, pause_s=KEY_PAUSE_S):
+        import pyautogui
+
+        self.gui = pyautogui
+        self.gui.PAUSE = pause_s
+
+    def jump(self):
+        # A tap: the release reaches the game before MIN_JUMP_HEIGHT, where Chrome's
+        # endJump() doesn't cut the rise, so it is a full jump (dino.sim models it)
+        self.gui.press(JUMP_KEY)
+
+    def fast_drop(self, hold_s):
+        """
+        Press/hold DOWN briefly to accelerate descent.
+        (If you're already on the ground, this just ducks for a moment; policies gate it with state.)
+        """
+        self.gui.keyDown(DROP_KEY)
+        time.sleep(hold_s)
+        self.gui.keyUp(DROP_KEY)
+
+
+class NullActuator:
+    """Records actions instead of pressing keys (replays, benchmarks, --dry-run)."""
+
+    def __init__(self):
+        self.actions = []
+
+    def jump(self):
+        self.actions.append("jump")
+
+    def fast_drop(self, hold_s):
+        self.actions.append("drop")
@@ -0,0 +1,163 @@
+import os
+import time
+import numpy as np
+
+# ----------------- SCREEN / WINDOW -----------------
+DINO_X = 580
+DINO_Y = 240
+DINO_WIDTH = 600
+DINO_HEIGHT = 155
+
+# ----------------- READINESS -----------------
+READY_TIMEOUT = 10.0  # give up waiting and start anyway after this many seconds
+READY_POLL = 0.05
+BG_TOL = 40  # |gray - background| below this counts as background
+BG_FRAC = 0.85  # a dino page is mostly flat background...
+GROUND_FRAC = 0.5  # ...with one near-full-width horizon row in the lower half
+START_BAND = (3, 9)  # rows above / below the horizon row watched for the ground scrolling
+START_FRAC = 0.01  # this much of that band changing between polls = the game is running
+
+
+class MssCapture:
+    """
+    Grabs the game rectangle off the screen. mss is only imported when this is built.
+    After set_region(rect) only that part of the game rect is grabbed and pasted
+    into the last full frame, so coordinates downstream don't change.
+    copy_frames=False (nothing draws on the frames): grab() hands out last_full
+    itself instead of a copy, so a region grab only moves the region's pixels.
+    """
+
+    def __init__(
+        self, left=DINO_X, top=DINO_Y, width=DINO_WIDTH, height=DINO_HEIGHT, copy_frames=True
+    ):
+        import mss
+
+        self.monitor = {"left": left, "top": top, "width": width, "height": height}
+        self.sct = mss.mss()
+        self.copy_frames = copy_frames
+        self.region = None  # (x1, y1, x2, y2) in game-frame coords
+        self.region_monitor = None
+        self.last_full = None
+
+    def set_region(self, rect):
+        """Grab only rect (game-frame coords) from now on; None = whole game rect again."""
+        self.region = rect
+        if rect is None:
+            self.region_monitor = None
+            return
+        x1, y1, x2, y2 = rect
+        self.region_monitor = {
+            "left": self.monitor["left"] + x1,
+            "top": self.monitor["top"] + y1,
+            "width": x2 - x1,
+            "height": y2 - y1,
+        }
+
+    def grab(self):
+        if self.region is None or self.last_full is None:
+            game_img = np.array(self.sct.grab(self.monitor))  # BGRA
+            self.last_full = game_img[:, :, :3].copy()  # BGR
+        else:
+            x1, y1, x2, y2 = self.region
+            roi_img = np.array(self.sct.grab(self.region_monitor))  # BGRA
+            self.last_full[y1:y2, x1:x2] = roi_img[:, :, :3]
+        # A renderer drawing on last_full would leave its overlay outside the region
+        return self.last_full.copy() if self.copy_frames else self.last_full
+
+    def close(self):
+        self.sct.close()
+
+
+class ReplayCapture:
+    """
+    Plays back recorded frames (a list of BGR arrays, or a directory of PNGs in name order).
+    grab() returns None once they run out, unless loop=True.
+    """
+
+    def __init__(self, frames, loop=False):
+        if isinstance(frames, str):
+            import cv2
+
+            names = sorted(n for n in os.listdir(frames) if n.endswith(".png"))
+            frames = [cv2.imread(os.path.join(frames, n), cv2.IMREAD_COLOR) for n in names]
+        self.frames = frames
+        self.loop = loop
+        self.i = 0
+
+    def grab(self):
+        if self.i >= len(self.frames):
+            if not self.loop or not self.frames:
+                return None
+            self.i = 0
+        frame = self.frames[self.i]
+        self.i += 1
+        return frame
+
+    def close(self):
+        pass
+
+
+def _horizon_row(frame):
+    """
+    Row of the near-full-width horizon line in the lower half, or None if this
+    isn't the Chrome dino page. Works for day and night mode since everything is
+    measured against the frame's own background.
+    """
+    gray = frame.mean(axis=2)
+    bg = np.median(gray)
+    ink = np.abs(gray - bg) >= BG_TOL
+    if 1.0 - ink.mean() < BG_FRAC:
+        return None
+    h = gray.shape[0]
+    rows = np.flatnonzero(ink[h // 2 :].mean(axis=1) >= GROUND_FRAC)
+    return h // 2 + int(rows[0]) if rows.size else None
+
+
+def game_visible(frame):
+    """Cheap "is the Chrome dino page in the capture rect?" check."""
+    return _horizon_row(frame) is not None
+
+
+def game_started(prev, frame):
+    """
+    True once the ground scrolls (or the intro stretches it) between two frames:
+    the game only does that after someone pressed space in its tab, so the tab
+    has the focus and our key presses will land there.
+    """
+    row = _horizon_row(frame)
+    if row is None or prev.shape != frame.shape:
+        return False
+    band = slice(max(row - START_BAND[0], 0), row + START_BAND[1])
+    diff = np.abs(frame[band].astype(np.int16) - prev[band]).max(axis=2) >= BG_TOL
+    return diff.mean() >= START_FRAC
+
+
+def wait_until_ready(capture, timeout_s=READY_TIMEOUT, poll_s=READY_POLL, wait_start=False):
+    """
+    Polls the capture until the game is visible, instead of a fixed sleep.
+    wait_start (live screen): then also waits for the user to start the game in
+    its tab, which is what the old fixed sleep gave them time to do.
+    Returns the first ready frame, or the last frame grabbed if we timed out
+    (None if the capture had nothing to give).
+    """
+    deadline = time.perf_counter() + timeout_s
+    frame = capture.grab()
+    while frame is not None and not game_visible(frame):
+        if time.perf_counter() >= deadline:
+            print(f"Game not recognised after {timeout_s:.0f}s, starting anyway.")
+            return frame
+        time.sleep(poll_s)
+        frame = capture.grab()
+    if frame is None or not wait_start:
+        return frame
+
+    print("Game found: press space in the dino tab to start it.")
+    deadline = time.perf_counter() + timeout_s
+    while True:
+        time.sleep(poll_s)
+        prev, frame = frame, capture.grab()
+        if frame is None or game_started(prev, frame):
+            return frame
+        if time.perf_counter() >= deadline:
+            print(f"Game not started after {timeout_s:.0f}s, starting anyway.")
+            return frame
@@ -0,0 +1,136 @@
+import time
+import argparse
+
+from .strategies import (
+    STRATEGIES,
+    build_actuator,
+    build_capture,
+    build_detector,
+    build_lookahead,
+    build_policy,
+    build_renderer,
+    build_sim,
+)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Dino bot (width-adaptive, no queue)")
+    p.add_argument(
+        "--strategy", choices=STRATEGIES, default="even-better", help="Bot behaviour"
+    )
+    p.add_argument(
+        "--invert", action="store_true", help="Invert grayscale before thresholding"
+    )
+    p.add_argument(
+        "--roi",
+        choices=("adaptive", "fixed"),
+        default="adaptive",
+        help="Size the lookahead ROI from the scroll speed, or keep it LOOK_W wide",
+    )
+    p.add_argument(
+        "--roi-grab",
+        action="store_true",
+        help="Only grab the lookahead ROI off the screen (with --roi adaptive)",
+    )
+    p.add_argument("--replay", help="Directory of PNG frames to play instead of the screen")
+    p.add_argument(
+        "--sim",
+        type=int,
+        metavar="SEED",
+        help="Play a simulated game (seeded) instead of the screen; no keys pressed",
+    )
+    p.add_argument(
+        "--sim-gap",
+        type=float,
+        default=1.0,
+        help="Simulated obstacle gaps vs Chrome's (< 1 = closer obstacles)",
+    )
+    p.add_argument("--dry-run", action="store_true", help="Don't press any keys")
+    p.add_argument("--headless", action="store_true", help="No debug overlay at all")
+    p.add_argument(
+        "--offscreen",
+        action="store_true",
+        help="Draw the debug overlay but don't open windows (to time it)",
+    )
+    p.add_argument(
+        "--bench", action="store_true", help="Report us/frame spent in the engine"
+    )
+    p.add_argument("--max-frames", type=int, help="Stop after this many frames")
+    p.add_argument(
+        "--ready-timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for the game to show up, then to be started, before starting anyway",
+    )
+    p.add_argument("-v", "--verbose", action="store_true", help="Log trigger widths")
+    args = p.parse_args(argv)
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from .capture import READY_TIMEOUT, wait_until_ready
+    from .engine import Engine
+
+    sim = None if args.sim is None else build_sim(args.strategy, args.sim, args.sim_gap)
+    # Frames only need to be copies if the overlay draws on them
+    capture = sim or build_capture(args.replay, copy_frames=not args.headless)
+    policy = build_policy(args.strategy, verbose=args.verbose)
+    detector = build_detector(args.strategy, invert=args.invert)
+    actuator = sim or build_actuator(args.strategy, dry_run=args.dry_run)
+    renderer = (
+        None if args.headless else build_renderer(args.strategy, show=not args.offscreen)
+    )
+    roi_grab = args.roi_grab and hasattr(capture, "set_region") and args.roi == "adaptive"
+    if args.roi_grab and args.roi != "adaptive":
+        print("--roi-grab: only with --roi adaptive, grabbing whole frames")
+    elif args.roi_grab and not roi_grab:
+        print("--roi-grab: this capture always grabs whole frames")
+    lookahead = (
+        build_lookahead(args.strategy, detector, policy, capture, roi_grab)
+        if args.roi == "adaptive"
+        else None
+    )
+
+    live = sim is None and args.replay is None
+    if live:
+        print("Waiting for the Chrome dino game... click the dino tab now.")
+    timeout = READY_TIMEOUT if args.ready_timeout is None else args.ready_timeout
+    first = wait_until_ready(capture, timeout, wait_start=live)
+    if first is None:
+        print("No frames to play.")
+        return 1
+
+    clock = sim.clock if sim else time.time
+    engine = Engine(
+        capture, detector, policy, actuator, renderer, clock=clock, lookahead=lookahead
+    )
+    frames = engine.run(first, max_frames=args.max_frames)
+    if args.bench and frames:
+        print(f"{frames} frames, {engine.busy_s * 1e6 / frames:.1f} us/frame")
+        if hasattr(policy, "plan_stats"):
+            st = policy.plan_stats()
+            print(
+                f"planning: {st['mean_us']:.1f} us/frame mean, {st['max_us']:.1f} max, "
+                f"{st['budget_cut']} budget cuts, {st['over_budget']} over budget, "
+                f"{st['partial']} nearest-blocks-only, "
+                f"{st['fallback']} fallbacks / {st['plans']} ({st['fallback_mean_us']:.1f} us mean)"
+            )
+        if lookahead is not None:
+            st = lookahead.roi_stats()
+            print(
+                f"roi: {st['detect_px']:.0f} px/frame detected (fixed {st['fixed_detect_px']}), "
+                f"{st['grab_px']:.0f} px/frame grabbed (frame {st['frame_px']}), "
+                f"look_w={st['look_w']}"
+            )
+            print(
+                f"roi: min horizon {st['min_horizon_s'] * 1e3:.0f} ms "
+                f"(need {st['reaction_s'] * 1e3:.0f}), {st['short']} short frames"
+            )
+    if sim:
+        result = "crashed" if sim.crashed else "alive"
+        print(f"sim: {result} after {sim.frame} game frames, {sim.cleared} obstacles cleared")
+    elif args.dry_run:
+        print(f"{frames} frames, actions: {actuator.actions}")
+    return 0
@@ -0,0 +1,71 @@
+import time
+
+
+class Engine:
+    """
+    capture -> detect -> policy (-> actuate) -> render, once per frame.
+
+    Every stage is a plain object, so any of them can be swapped:
+      capture.grab() -> BGR frame, or None when there are no more frames
+      detector(frame) -> obs (whatever the policy/renderer of the strategy expect)
+      policy.step(obs, now, actuator)
+      actuator.jump() / actuator.fast_drop(hold_s)
+      renderer.draw(frame, obs, policy) -> False to quit (renderer may be None)
+      clock() -> seconds, the `now` policies see (time.time, or a simulator's clock)
+      lookahead.update(frame, obs, now) resizes the ROI for the next frame (may be None)
+    """
+
+    def __init__(
+        self,
+        capture,
+        detector,
+        policy,
+        actuator,
+        renderer=None,
+        clock=time.time,
+        lookahead=None,
+    ):
+        self.capture = capture
+        self.detector = detector
+        self.policy = policy
+        self.actuator = actuator
+        self.renderer = renderer
+        self.clock = clock
+        self.lookahead = lookahead
+        self.frames = 0
+        self.busy_s = 0.0  # time spent in step() (detect + policy + lookahead + render)
+
+    def step(self, game_frame, now=None):
+        """Runs one frame through detect/policy/render. Returns False to stop."""
+        if now is None:
+            now = self.clock()
+        t0 = time.perf_counter()
+        obs = self.detector(game_frame)
+        self.policy.step(obs, now, self.actuator)
+        if self.lookahead is not None:
+            self.lookahead.update(game_frame, obs, now)
+        keep_going = True
+        if self.renderer is not None:
+            keep_going = self.renderer.draw(game_frame, obs, self.policy)
+        self.busy_s += time.perf_counter() - t0
+        self.frames += 1
+        return keep_going
+
+    def run(self, first_frame=None, max_frames=None):
+        """Main loop; first_frame is e.g. the frame wait_until_ready() returned."""
+        game_frame = first_frame
+        try:
+            while max_frames is None or self.frames < max_frames:
+                now = self.clock()
+                if game_frame is None:
+                    game_frame = self.capture.grab()
+                    if game_frame is None:
+                        break
+                if not self.step(game_frame, now):
+                    break
+                game_frame = None
+        finally:
+            self.capture.close()
+            if self.renderer is not None:
+                self.renderer.close()
+        return self.frames
@@ -0,0 +1,159 @@
+import math
+import statistics
+
+from .detect import LOOK_H, LOOK_W, LOOK_X_REL, LOOK_Y_OFF
+
+# =============================================================================
+# Speed-adaptive lookahead: the ROI only has to reach far enough right that a
+# whole block is in view `reaction_s` before it gets to the trigger line. Early
+# in a run (slow) that is much less than LOOK_W; late in a run (fast) it can be
+# more. Detection, and the screen grab with --roi-grab, follow the window.
+# =============================================================================
+
+# ----------------- SPEED ESTIMATE -----------------
+SPEED_EMA = 0.3  # weight of the newest speed sample
+MAX_FRAME_SHIFT_PX = 60  # larger edge jumps between frames = a different block
+EDGE_PX = 8  # edges this close to the ROI border may be clipped: no speed samples
+SPEED_GAME_FPS = 60  # the game steps at this rate (tick_frames is in its frames)
+
+# ----------------- WINDOW SIZING -----------------
+MAX_BLOCK_PX = 80  # widest block (3 large cacti + gaps) must fit in view entirely
+SPEED_SAFETY = 1.25  # size for this much more than the estimated speed
+REACTION_S = 0.1  # trigger rules: one bot frame + key latency, with room to spare
+MIN_LOOK_W = 120
+LOOK_W_STEP = 16  # widths are rounded up to this, and shrink only by 2 steps at once
+
+
+class SpeedEstimator:
+    """
+    Scroll speed (px/s) as an EMA of how fast block edges move left: median shift
+    of every lead/trail edge that isn't clipped by the ROI border, matched to the
+    nearest edge of the same kind last frame. Works on plain block obs (nearest
+    block only) and on planner obs ("blocks" = every block in view).
+    """
+
+    def __init__(self):
+        self.speed = None  # px/s
+        self.tick_frames = 1.0  # game frames per bot frame (EMA)
+        self.prev = None  # (t, [(edge kind, x), ...]) last frame
+
+    def update(self, obs, now):
+        if obs is None:
+            self.prev = None
+            return self.speed
+        x1, _, x2, _ = obs["rect"]
+        edges = [
+            (kind, b[kind + "_x"])
+            for b in obs.get("blocks", (obs,))
+            for kind in ("lead", "trail")
+            if x1 + EDGE_PX <= b[kind + "_x"] < x2 - EDGE_PX
+        ]
+
+        prev, self.prev = self.prev, (now, edges)
+        if prev is None or now <= prev[0]:
+            return self.speed
+        shifts = []
+        for kind, x in edges:
+            moved = [px - x for k, px in prev[1] if k == kind and 0 < px - x <= MAX_FRAME_SHIFT_PX]
+            if moved:
+                shifts.append(min(moved))
+        if not shifts:
+            return self.speed
+        dt = now - prev[0]
+        sample = statistics.median(shifts) / dt  # np.median costs ~15 us on a few values
+        self.speed = sample if self.speed is None else (
+            SPEED_EMA * sample + (1 - SPEED_EMA) * self.speed
+        )
+        self.tick_frames += SPEED_EMA * (dt * SPEED_GAME_FPS - self.tick_frames)
+        return self.speed
+
+
+class LookaheadWindow:
+    """
+    Resizes detector.look_w every frame (and the capture's grab region when
+    roi_grab) so that a block up to MAX_BLOCK_PX wide is fully visible at least
+    reaction_s before its lead reaches trigger_x, at SPEED_SAFETY x the estimated
+    speed. Until there is an estimate the window stays at LOOK_W; it grows at
+    once and shrinks with a little hysteresis.
+
+    estimator: share the policy's SpeedEstimator (it updates it) or None to run
+    our own.
+    """
+
+    def __init__(
+        self,
+        detector,
+        trigger_x,
+        reaction_s=REACTION_S,
+        capture=None,
+        roi_grab=False,
+        estimator=None,
+    ):
+        self.detector = detector
+        self.trigger_x = trigger_x
+        self.reaction_s = reaction_s
+        self.capture = capture if roi_grab else None
+        self.own_estimator = estimator is None
+        self.estimator = SpeedEstimator() if estimator is None else estimator
+        self.frame_w = None
+        self.frame_px = 0
+        self.stats = {"frames": 0, "detect_px": 0, "grab_px": 0, "short": 0}
+        self.min_horizon_s = math.inf
+        detector.look_w = LOOK_W
+
+    def rect(self, look_w):
+        """Game-frame (x1, y1, x2, y2) of a window look_w wide."""
+        return (LOOK_X_REL, LOOK_Y_OFF, LOOK_X_REL + look_w, LOOK_Y_OFF + LOOK_H)
+
+    def target_w(self, speed):
+        """Narrowest window (rounded up to LOOK_W_STEP) that keeps the reaction margin."""
+        right_x = self.trigger_x + speed * SPEED_SAFETY * self.reaction_s + MAX_BLOCK_PX
+        w = math.ceil((right_x - LOOK_X_REL) / LOOK_W_STEP) * LOOK_W_STEP
+        return min(max(w, MIN_LOOK_W), self.frame_w - LOOK_X_REL)
+
+    def update(self, game_frame, obs, now):
+        """Called after each frame's detection; sizes the window for the next one."""
+        if self.frame_w is None:
+            self.frame_w = game_frame.shape[1]
+            self.frame_px = game_frame.shape[0] * game_frame.shape[1]
+            if self.capture is not None:
+                self.capture.set_region(self.rect(self.detector.look_w))
+        speed = self.estimator.update(obs, now) if self.own_estimator else self.estimator.speed
+
+        w = self.detector.look_w
+        if speed:
+            target = self.target_w(speed)
+            if target > w or target <= w - 2 * LOOK_W_STEP:
+                w = target
+            horizon_s = (LOOK_X_REL + w - MAX_BLOCK_PX - self.trigger_x) / speed
+            self.min_horizon_s = min(self.min_horizon_s, horizon_s)
+            self.stats["short"] += horizon_s < self.reaction_s
+
+        stats = self.stats
+        stats["frames"] += 1
+        stats["detect_px"] += self.detector.look_w * LOOK_H
+        if self.capture is not None:
+            stats["grab_px"] += self.detector.look_w * LOOK_H
+        else:
+            stats["grab_px"] += self.frame_px
+
+        if w != self.detector.look_w:
+            self.detector.look_w = w
+            if self.capture is not None:
+                self.capture.set_region(self.rect(w))
+
+    def roi_stats(self):
+        """Per-frame pixel counts, vs the fixed LOOK_W window and full-frame grabs."""
+        s = self.stats
+        n = max(s["frames"], 1)
+        return {
+            "frames": s["frames"],
+            "look_w": self.detector.look_w,
+            "detect_px": s["detect_px"] / n,
+            "fixed_detect_px": LOOK_W * LOOK_H,
+            "grab_px": s["grab_px"] / n,
+            "frame_px": self.frame_px,
+            "reaction_s": self.reaction_s,
+            "min_horizon_s": self.min_horizon_s,
+            "short": s["short"],
+        }
@@ -0,0 +1,572 @@
+import math
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from .detect import LOOK_H, LOOK_Y_OFF
+from .lookahead import EDGE_PX, MAX_BLOCK_PX, MAX_FRAME_SHIFT_PX, SpeedEstimator
+from .policy import LandBehindPolicy
+
+# =============================================================================
+# Look-ahead planner: instead of "jump when lead_x <= trig_x", search jump/drop
+# timings for ALL blocks in view against a precomputed jump-arc table and pick
+# the schedule that clears every block by the widest margin.
+# =============================================================================
+
+# ----------------- GAME PHYSICS (Chrome Runner / Trex config, in game frames) -----------------
+GAME_FPS = 60  # the game steps its physics at this rate, whatever our capture rate is
+JUMP_VELOCITY = 10  # px/frame upwards when the jump starts, plus speed / 10
+GRAVITY = 0.6  # px/frame^2
+MIN_JUMP_HEIGHT = 30  # px; past this, releasing the jump key would cut the rise ...
+MAX_JUMP_HEIGHT = 63  # px; ... and past this the rise is cut anyway:
+CUT_VELOCITY = 5  # upward velocity capped to this
+SPEED_DROP_VELOCITY = 1  # DOWN while airborne: velocity is SET to this (downwards) ...
+SPEED_DROP_COEFFICIENT = 3  # ... and the dino moves 3x as fast until DOWN is released
+START_SPEED = 6  # game speed (px/frame) range; the takeoff velocity depends on it
+MAX_SPEED = 13
+SPEED_BAND = 0.5  # planner arc tables per band of game speed this wide ...
+SPEED_SLACK = 0.75  # ... each covering the speeds this far either side of it
+
+# ----------------- DINO / INPUT -----------------
+GROUND_Y = LOOK_Y_OFF + LOOK_H  # lookahead ROI bottom sits on the ground line
+DINO_BACK_X = 4  # dino body in game-frame x (matches dino.sprites)
+DINO_FRONT_X = 48
+INPUT_LATENCY_S = 0.03  # key press -> game reacts (capture + pyautogui + browser)
+MIN_CLEARANCE_PX = 2  # schedules clearing a block by less than this are infeasible
+MIN_DROP_FRAME = 5  # no DOWN in the first frames of a jump (cf. MIN_AIR_TIME)
+DROP_HOLD_S = 0.04  # DOWN is held this long; the speed drop only lasts while it is
+DROP_EARLY_FRAMES = (0, 2, 4)  # try DOWN this many frames before a block is passed
+
+# ----------------- SEARCH -----------------
+PLAN_BUDGET_US = 300  # per-frame planning budget; best schedule so far is used
+DEADLINE_SLACK_US = 30  # search stops this early: the node it is in + returning
+PLAN_HORIZON_S = 1.5  # ignore blocks the dino reaches later than this
+MAX_PLAN_BLOCKS = 4
+
+
+def jump_arcs(drop_frames, speeds, holds):
+    """
+    Height (px above ground) of the dino's feet on each game frame, from the frame
+    the jump key is handled on (already off the ground) until it is back on the
+    ground, for every (drop frame, speed, DOWN hold) at once: rows in that order,
+    -1 once landed. drop frame = frame DOWN is handled on (inf = no drop), released
+    hold frames later. A tap's release comes before MIN_JUMP_HEIGHT, so only the
+    MAX_JUMP_HEIGHT cut applies. Rounds like JS Math.round in Chrome's y-down canvas.
+    """
+    n = len(speeds) * len(holds)
+    d = np.repeat(np.asarray(drop_frames, float), n)
+    k = np.tile(holds, len(d) // len(holds))
+    y = np.zeros(d.size)  # y, v: canvas coords (down = +)
+    v = -(JUMP_VELOCITY + np.tile(np.repeat(speeds, len(holds)), len(drop_frames)) / 10)
+    reached_min = np.zeros(d.size, bool)
+    up = np.ones(d.size, bool)
+    rows = []
+    f = 0
+    while up.any():
+        v = np.where(d == f, SPEED_DROP_VELOCITY, v)
+        dropping = (d <= f) & (f < d + k)
+        y += np.floor(v * np.where(dropping, SPEED_DROP_COEFFICIENT, 1) + 0.5)
+        v += GRAVITY
+        reached_min |= dropping | (-y > MIN_JUMP_HEIGHT)
+        cut = ((-y > MAX_JUMP_HEIGHT) | dropping) & reached_min & (v < -CUT_VELOCITY)
+        v = np.where(cut, -CUT_VELOCITY, v)
+        landed = y > 0
+        rows.append(np.where(up, np.where(landed, 0, -y), -1))
+        up &= ~landed
+        f += 1
+    return np.array(rows, int).T
+
+
+def _build_arc_table(speeds, hold_s=DROP_HOLD_S):
+    """
+    The game speed and the frames DOWN stays held (hold_s falls on 2 or 3 frame
+    boundaries) aren't known exactly, so every arc is the envelope over `speeds`
+    and both holds:
+    the lowest the dino could be on each frame, on the ground only once the
+    slowest variant lands.
+    ARC[d] = DOWN handled on frame d for d in 1..(first possible landing - 1);
+    ARC[0] = no drop. LAND[d] = frame the dino is back on the ground.
+    RMIN[d][a][b] = lowest height over frames a..b (b < LAND[d]) = what a block
+    overlapping the dino on those frames has to stay under.
+    """
+    holds = sorted({math.floor(hold_s * GAME_FPS), math.ceil(hold_s * GAME_FPS)})
+    no_drop = jump_arcs([math.inf], speeds, holds)
+    rows = int((no_drop >= 0).sum(axis=1).min()) - 1  # later DOWN could be a duck
+    h = jump_arcs(np.r_[math.inf, np.arange(1, rows)], speeds, holds)
+    h = h.reshape(rows, len(speeds) * len(holds), -1)
+    lengths = (h >= 0).sum(axis=2).max(axis=1)
+    low = np.maximum(h, 0).min(axis=1)  # 0 once any variant has landed
+
+    arcs, rmin = [], []
+    for arc, n in zip(low, lengths):
+        arc = arc[:n].copy()
+        arc[-1] = 0
+        arcs.append(arc.tolist())
+        # row a = heights from frame a on; running min along it
+        tri = np.full((n, n), np.iinfo(arc.dtype).max)
+        for a in range(n):
+            tri[a, : n - a] = arc[a:]
+        tri = np.minimum.accumulate(tri, axis=1).tolist()
+        rmin.append([row[: n - a] for a, row in enumerate(tri)])
+    land = [len(h) - 1 for h in arcs]
+    return arcs, land, rmin
+
+
+def _build_reach_table(arc):
+    """REACH[h] = (first, last) frame of the no-drop arc at height >= h (None if never)."""
+    reach = []
+    for h in range(max(arc) + 1):
+        frames = [f for f, y in enumerate(arc) if y >= h]
+        reach.append((frames[0], frames[-1]))
+    return reach
+
+
+def arc_tables(speed=None):
+    """
+    (ARC, LAND, RMIN, REACH) for game speed `speed` (px/frame), +-SPEED_SLACK.
+    None = speed unknown: envelope over the whole START_SPEED..MAX_SPEED range.
+    """
+    if speed is None:
+        return _band_tables(None)
+    speed = min(max(speed, START_SPEED), MAX_SPEED)
+    return _band_tables(round(speed / SPEED_BAND))
+
+
+@lru_cache(maxsize=None)
+def _band_tables(band):
+    """~5 ms each, so only built when needed: see Planner.__init__ / Planner.prepare."""
+    if band is None:
+        speeds = np.arange(START_SPEED, MAX_SPEED + 0.5, 1.0)
+    else:
+        mid = band * SPEED_BAND
+        speeds = np.arange(mid - SPEED_SLACK, mid + SPEED_SLACK + 0.01, 0.25)
+    arc, land, rmin = _build_arc_table(speeds)
+    return arc, land, rmin, _build_reach_table(arc[0])
+
+
+def peak_frame():
+    """Frame the no-drop arc tops out at, any speed (drop decisions happen around here)."""
+    return arc_tables()[3][-1][0]
+
+
+# =============================================================================
+# PLANNER
+# =============================================================================
+def _overlap_frames(block, v):
+    """(first, last) game frame (from now) the block overlaps the dino in x, or None if passed."""
+    first = math.ceil((block["lead_x"] - DINO_FRONT_X) / v)
+    last = math.floor((block["trail_x"] - DINO_BACK_X) / v)
+    return (first, last) if last >= 0 else None
+
+
+class Planner:
+    """
+    Branch-and-bound over (jump frame, drop frame) per jump, nearest block first.
+    One jump may clear several blocks; the next jump can only start once the
+    previous one has landed (and a press only goes out once we see it land, so it
+    acts latency frames later), which is what makes an early drop worth it (or
+    fatal) when two blocks are close together. The score of a schedule is its
+    smallest clearance margin over every block (higher is better); among equal
+    moves from one jump frame, the one back on the ground first wins.
+    """
+
+    def __init__(self, budget_us=PLAN_BUDGET_US, latency_s=INPUT_LATENCY_S):
+        self.budget_us = budget_us
+        self.latency = math.ceil(latency_s * GAME_FPS)  # first frame a press can act on
+        arc_tables()  # before there is a speed estimate
+        arc_tables(START_SPEED)  # every game starts here
+
+    def prepare(self, speed_px_s):
+        """
+        Builds the tables for this speed and the next band up (the game only speeds
+        up), so plan() doesn't have to. Call it on frames with nothing to plan.
+        """
+        v = speed_px_s / GAME_FPS
+        arc_tables(v)
+        arc_tables(v + SPEED_BAND)
+
+    def _fly(self, spans, i, j, d):
+        """
+        Jump on frame j with arc row d, starting at span i. Returns (next span,
+        min margin over the spans it clears, landing frame), or None if it comes
+        down on one. Spans already overlapping before the jump are infeasible.
+        """
+        land = j + self.land[d]
+        rmin = self.rmin[d]
+        margin = math.inf
+        k = i
+        while k < len(spans):
+            first, last, height = spans[k]
+            if first >= land:
+                break
+            a, b = max(first, 0) - j, last - j
+            if a < 1 or b >= self.land[d]:
+                return None
+            margin = min(margin, rmin[a][b - a] - height)
+            if margin < MIN_CLEARANCE_PX:
+                return None
+            k += 1
+        return k, margin, land
+
+    def _moves(self, spans, i, j, drops):
+        """
+        Outcomes of jumping on frame j, best margin first. Per next span only the
+        widest-margin and the first-to-land move are kept (landing early is what
+        makes room for the next jump).
+        """
+        widest, first_down = {}, {}
+        for d in drops:
+            out = self._fly(spans, i, j, d)
+            if out is None:
+                continue
+            k, margin, land = out
+            move = (k, d, margin, land)
+            if k not in widest or (margin, -land) > (widest[k][2], -widest[k][3]):
+                widest[k] = move
+            if k not in first_down or (-land, margin) > (-first_down[k][3], first_down[k][2]):
+                first_down[k] = move
+        moves = set(widest.values()) | set(first_down.values())
+        return sorted(moves, key=lambda m: (m[2], -m[3]), reverse=True)
+
+    def _drops(self, spans, i, j, min_d):
+        """
+        DOWN as early as allowed, and just before (DROP_EARLY_FRAMES) each span the
+        no-drop arc from frame j clears.
+        """
+        air, rows = self.land[0], len(self.arc)
+        drops = [max(min_d, MIN_DROP_FRAME)]  # land as soon as possible
+        k = i
+        while k < len(spans) and spans[k][0] < j + air and spans[k][1] < j + air - 1:
+            for early in DROP_EARLY_FRAMES:
+                d = spans[k][1] - j + 1 - early
+                if max(min_d, MIN_DROP_FRAME) <= d < rows and d not in drops:
+                    drops.append(d)
+            k += 1
+        return [d for d in drops if d < rows]
+
+    def _window(self, span):
+        """(earliest, latest) jump frame whose no-drop arc clears span, or None."""
+        first, last, height = span
+        need = height + MIN_CLEARANCE_PX
+        if need >= len(self.reach):
+            return None
+        rise, fall = self.reach[need]
+        return last - fall, first - rise
+
+    def _lands_in_time(self, spans, k, land):
+        """True if landing on frame `land` leaves span k's whole jump window open."""
+        if k == len(spans):
+            return True
+        window = self._window(spans[k])
+        return window is not None and land + self.latency <= window[0]
+
+    def plan(self, blocks, speed_px_s, airborne=None):
+        """
+        blocks: detector blocks (nearest first, with "top_y"); speed_px_s: scroll speed.
+        airborne: None on the ground, else (jump_frame, drop_row) of the jump already
+        pressed, frames relative to now (drop_row 0 = no DOWN yet).
+
+        Returns {"jumps": [(jump_frame, drop_row), ...], "margin": px, "us": float,
+        "nodes": int, "complete": bool, "partial": bool}. When no schedule clears
+        every block, partial is True and the schedule clears the most of the
+        nearest ones; None if not even the nearest can be cleared.
+        Frames count from now; a press made now acts on frame self.latency.
+        """
+        v = speed_px_s / GAME_FPS
+        # A band not built yet by prepare() is built here, before the search's clock
+        # starts: that frame runs long rather than planning without a budget
+        self.arc, self.land, self.rmin, self.reach = arc_tables(v)
+        t0 = time.perf_counter()
+        deadline = t0 + (self.budget_us - DEADLINE_SLACK_US) * 1e-6
+        horizon = PLAN_HORIZON_S * GAME_FPS
+
+        spans = []
+        for block in blocks:
+            if block["trail_x"] >= block["rect"][2] - 1:  # cut off by the ROI: assume the worst
+                block = dict(block, trail_x=block["trail_x"] + MAX_BLOCK_PX)
+            span = _overlap_frames(block, v)
+            if span is None:
+                continue
+            if span[0] > horizon or len(spans) == MAX_PLAN_BLOCKS:
+                break
+            height = GROUND_Y - block["top_y"]
+            if spans and span[0] <= spans[-1][1]:
+                # Overlaps the previous block in time: one arc has to clear both
+                prev = spans.pop()
+                span = (prev[0], max(prev[1], span[1]), max(prev[2], height))
+            else:
+                span += (height,)
+            spans.append(span)
+
+        self.best = None
+        self.partial = (0, -math.inf, None)  # (spans cleared, margin, jumps) if best stays None
+        self.nodes = 0
+        self.complete = True
+        if airborne is None:
+            self._search(spans, 0, self.latency, math.inf, [], deadline)
+        else:
+            j, d = airborne
+            drops = [d] if d else [0] + self._drops(spans, 0, j, self.latency - j)
+            for k, row, margin, land in self._moves(spans, 0, j, drops):
+                self._search(spans, k, land + self.latency, margin, [(j, row)], deadline)
+
+        cleared = len(spans)
+        if self.best is None:
+            # The far blocks can't be cleared (yet; e.g. one clipped by the ROI is
+            # assumed MAX_BLOCK_PX longer): plan for the nearest ones that can be
+            cleared, margin, jumps = self.partial
+            if not cleared:
+                return None
+        else:
+            margin, jumps = self.best
+        return {
+            "jumps": jumps,
+            "margin": margin,
+            "us": (time.perf_counter() - t0) * 1e6,
+            "nodes": self.nodes,
+            "complete": self.complete,
+            "partial": cleared < len(spans),
+        }
+
+    def _search(self, spans, i, earliest, margin, jumps, deadline):
+        """Depth-first: every block from span i on still has to be cleared."""
+        self.nodes += 1
+        if (i, margin) > self.partial[:2]:
+            self.partial = (i, margin, list(jumps))
+        if i == len(spans):
+            if self.best is None or margin > self.best[0]:
+                self.best = (margin, list(jumps))
+            return
+        if time.perf_counter() > deadline:
+            self.complete = False
+            return
+
+        # The no-drop arc has to be up at `first` and still up at `last`, and a drop
+        # only lowers it (bar late in the fall, where it never helps), so span i's
+        # no-drop margin bounds the moves from frame j: try the best bounds first
+        # and stop once they can't win
+        window = self._window(spans[i])
+        if window is None:
+            return
+        first, last, height = spans[i]
+        rmin = self.rmin[0]
+        bounds = []
+        for j in range(max(earliest, window[0]), window[1] + 1):
+            bounds.append((rmin[first - j][last - first] - height, j))
+        bounds.sort(reverse=True)
+
+        for bound, j in bounds:
+            best = self.best[0] if self.best is not None else MIN_CLEARANCE_PX - 1
+            if min(margin, bound) <= best:
+                return
+            if time.perf_counter() > deadline:
+                self.complete = False
+                return
+            # DOWN only pays when the no-drop landing eats into the next jump's window
+            out = self._fly(spans, i, j, 0)
+            if out is not None and self._lands_in_time(spans, out[0], out[2]):
+                moves = [(out[0], 0, out[1], out[2])]
+            else:
+                moves = self._moves(spans, i, j, [0] + self._drops(spans, i, j, 1))
+            for k, d, m, land in moves:
+                m = min(margin, m)
+                if self.best is not None and m <= self.best[0]:
+                    break  # moves are sorted by margin: nothing better below
+                jumps.append((j, d))
+                self._search(spans, k, land + self.latency, m, jumps, deadline)
+                jumps.pop()
+            if not self.complete:
+                return
+
+
+# =============================================================================
+# POLICY
+# =============================================================================
+class PlannerPolicy(LandBehindPolicy):
+    """
+    plan: estimates the scroll speed from how block edges move, re-plans
+    every frame over all blocks in view and presses whatever is due now. Until
+    there is a speed estimate, or when no schedule clears everything, the
+    even-better rules (LandBehindPolicy) decide instead.
+    """
+
+    def __init__(self, budget_us=PLAN_BUDGET_US, latency_s=INPUT_LATENCY_S, verbose=False):
+        super().__init__(drop_hold=DROP_HOLD_S, verbose=verbose)
+        self.planner = Planner(budget_us, latency_s)
+        self.estimator = SpeedEstimator()
+        self.seen = None  # (t, blocks) last frame, incl. dead-reckoned ones
+        self.jump_t = None  # our jump in progress (key press times)
+        self.drop_t = None
+        self.planned = False  # jump_t is the planner's, not the fallback's
+        self.last_plan = None
+        self.stats = {
+            "plans": 0,
+            "us_total": 0.0,
+            "us_max": 0.0,
+            "cut": 0,
+            "over": 0,
+            "partial": 0,
+            "fallback": 0,
+            "fallback_us": 0.0,
+        }
+
+    @property
+    def speed(self):
+        return self.estimator.speed
+
+    @property
+    def tick_frames(self):
+        return self.estimator.tick_frames
+
+    def _track_blocks(self, obs, now):
+        """
+        Blocks in view, plus the ones that already scrolled out past the ROI's left
+        edge but may still be under the dino (dead-reckoned from where they were
+        last seen). A lead clipped by that edge is dead-reckoned the same way.
+        """
+        blocks = obs["blocks"] if obs is not None else []
+        seen, self.seen = self.seen, None
+        if seen is None or not self.speed:
+            self.seen = (now, blocks)
+            return blocks
+
+        t, old = seen
+        shift = self.speed * (now - t)
+        x1 = blocks[0]["rect"][0] if blocks else old[0]["rect"][0] if old else 0
+        moved = [
+            dict(b, lead_x=round(b["lead_x"] - shift), trail_x=round(b["trail_x"] - shift))
+            for b in old
+        ]
+        tol = MAX_FRAME_SHIFT_PX // 4
+        visible = []
+        for block in blocks:
+            if block["trail_x"] < x1 + EDGE_PX:
+                continue  # the dead-reckoned copy is better
+            if block["lead_x"] < x1 + EDGE_PX:
+                for b in moved:
+                    if abs(b["trail_x"] - block["trail_x"]) <= tol:
+                        block = dict(block, lead_x=min(block["lead_x"], b["lead_x"]))
+                        break
+            visible.append(block)
+        out = [
+            b
+            for b in moved
+            if DINO_BACK_X <= b["trail_x"] < x1 + EDGE_PX + tol
+            and not any(abs(b["trail_x"] - v["trail_x"]) <= tol for v in visible)
+        ]
+        out += visible
+        self.seen = (now, out)
+        return out
+
+    # ----------------- own jump state -----------------
+    def _airborne(self, now):
+        """(jump_frame, drop_row) of our jump relative to now, or None once landed."""
+        if self.jump_t is None:
+            return None
+        lat = self.planner.latency
+        j = round((self.jump_t - now) * GAME_FPS) + lat
+        arc, land = arc_tables(self.speed / GAME_FPS if self.speed else None)[:2]
+        d = 0
+        if self.drop_t is not None:
+            d = min(max(round((self.drop_t - self.jump_t) * GAME_FPS), 1), len(arc) - 1)
+        if j + land[d] <= 0:
+            self.jump_t = self.drop_t = None
+            return None
+        return j, d
+
+    def _jumping(self, now):
+        # The fallback's JUMP_AIR_TIME guess is a full jump from the last press; we
+        # know when ours lands (drops included). A second tap in the air isn't just
+        # ignored either: its release cuts the rise (endJump)
+        return self._airborne(now) is not None
+
+    def should_fast_drop_to_land_behind(self, now):
+        # The planner's jumps drop when (and if) it planned them to; the fallback's
+        # "trail passed SAFE_CLEAR_X" drop can land one on the next block
+        if self.planned and self._airborne(now) is not None:
+            return False
+        return super().should_fast_drop_to_land_behind(now)
+
+    def _due(self, frame):
+        """A press made now acts on `frame` (within half a bot frame)."""
+        return frame - self.planner.latency < 0.5 * max(self.tick_frames, 1.0)
+
+    # ----------------- step -----------------
+    def step(self, obs, now, act):
+        self.estimator.update(obs, now)
+        blocks = self._track_blocks(obs, now)
+        airborne = self._airborne(now)
+        self.last_plan = None
+
+        if blocks and self.speed:
+            # Timed here, not with plan["us"]: searches that find nothing cost too
+            t0 = time.perf_counter()
+            plan = self.planner.plan(blocks, self.speed, airborne)
+            us = (time.perf_counter() - t0) * 1e6
+            stats = self.stats
+            stats["plans"] += 1
+            stats["us_total"] += us
+            stats["us_max"] = max(stats["us_max"], us)
+            stats["cut"] += not self.planner.complete
+            stats["over"] += us > self.planner.budget_us
+            if plan is not None:
+                stats["partial"] += plan["partial"]
+                self.last_plan = plan
+                self._execute(plan, obs, now, act, airborne)
+                return
+            stats["fallback"] += 1
+            stats["fallback_us"] += us
+        elif self.speed:
+            self.planner.prepare(self.speed)  # nothing in view: build tables ahead
+
+        # Fallback: the even-better rules, keeping our own jump state in sync
+        jumped_t = self.last_jump_t
+        super().step(obs, now, act)
+        if self.last_jump_t != jumped_t:
+            self.jump_t, self.drop_t = self.last_jump_t, None
+            self.planned = False
+        elif self.track is not None and self.track["drop_done"] and self.drop_t is None:
+            if self.jump_t is not None and self.track["jump_t"] == self.jump_t:
+                self.drop_t = now
+
+    def _execute(self, plan, obs, now, act, airborne):
+        self._update_airborne_and_arm(obs, now)
+        self.update_obstacle_tracking(obs)
+        if not plan["jumps"]:
+            return  # everything in view is beyond the horizon
+        j, d = plan["jumps"][0]
+        if airborne is None:
+            if self._due(j):
+                act.jump()
+                self.jump_t, self.drop_t = now, None
+                self.planned = True
+                self.last_jump_t = now
+                self.in_air = True
+                self.armed = False
+                if obs is not None:
+                    self.start_obstacle_tracking(obs, now)
+        elif d and self.drop_t is None and self._due(j + d):
+            act.fast_drop(self.drop_hold)
+            self.drop_t = now
+            if self.track is not None:
+                self.track["drop_done"] = True
+                self.track["active"] = False
+
+    def plan_stats(self):
+        """
+        Planning cost summary. us are per planned frame, fallbacks (no schedule
+        found) included; fallback_mean_us is those frames alone. partial = plans
+        that only clear the nearest blocks.
+        """
+        s = self.stats
+        return {
+            "plans": s["plans"],
+            "mean_us": s["us_total"] / s["plans"] if s["plans"] else 0.0,
+            "max_us": s["us_max"],
+            "budget_cut": s["cut"],
+            "over_budget": s["over"],
+            "partial": s["partial"],
+            "fallback": s["fallback"],
+            "fallback_mean_us": s["fallback_us"] / s["fallback"] if s["fallback"] else 0.0,
+        }
@@ -0,0 +1,152 @@
+# ----------------- POLICY DEFAULTS -----------------
+# Width classification: wider than this => "large" trigger
+LARGE_PX = 45
+
+# Fast drop (DOWN) parameters
+MIN_AIR_TIME = 0.09  # don't attempt fast-drop immediately after jump
+LANDED_AFTER = 0.1  # conservative "landed" time since jump; tune if you want
+JUMP_AIR_TIME = 0.6  # press -> landing of a full jump (~35 game frames + input latency)
+
+# Safe x: obstacle trailing edge left of this x => it's behind the dino
+SAFE_CLEAR_X = 100
+
+
+class StripPolicy:
+    """opencv-dino-game: jump whenever the strip sees something."""
+
+    def step(self, obs, now, act):
+        if obs["hit"]:
+            act.jump()
+
+
+class ReactivePolicy:
+    """
+    better-dino: jump when the next block's lead edge reaches a width-dependent
+    trigger x, re-arm once it is behind SAFE_CLEAR_X, and keep tapping DOWN
+    while airborne to shorten the jump.
+    """
+
+    def __init__(self, small_jump_x=150, large_jump_x=130, drop_hold=0.04, verbose=False):
+        self.small_jump_x = small_jump_x
+        self.large_jump_x = large_jump_x
+        self.drop_hold = drop_hold
+        self.verbose = verbose
+        self.safe_clear_x = SAFE_CLEAR_X
+
+        self.last_jump_t = -999.0
+        self.last_drop_t = -999.0
+        self.armed = True  # can jump when armed
+        self.in_air = False
+
+    @property
+    def max_trigger_x(self):
+        return max(self.small_jump_x, self.large_jump_x)
+
+    def trigger_x_for_width(self, width_px):
+        """Wider obstacle => jump earlier (smaller x)."""
+        return self.large_jump_x if width_px > LARGE_PX else self.small_jump_x
+
+    def _jumping(self, now):
+        """Our last jump is still in the air (Chrome drops jump presses until it lands)."""
+        return now - self.last_jump_t < JUMP_AIR_TIME
+
+    def _update_airborne_and_arm(self, obs, now):
+        # Update in_air using time since jump (simple but effective)
+        if self.in_air and (now - self.last_jump_t) > LANDED_AFTER:
+            self.in_air = False
+
+        # Re-arm once the current obstacle is clearly behind us
+        # (no obstacle visible => safe to arm)
+        if obs is None or obs["trail_x"] < self.safe_clear_x:
+            self.armed = True
+
+    def _maybe_jump(self, obs, now, act):
+        if obs is None:
+            return False
+        # A block behind SAFE_CLEAR_X is the one we're passing (its lead is clipped to
+        # the ROI edge, so it's always "past" the trigger): jumping for it again only
+        # disarms us, and the next block is usually in view before this one leaves.
+        if obs["trail_x"] < self.safe_clear_x:
+            return False
+        trig_x = self.trigger_x_for_width(obs["width_px"])
+        if self.verbose:
+            print("triggered width: ", obs["width_px"])
+        # A press in the air is dropped: stay armed and jump as soon as we've landed
+        # (obstacles closer than one jump length)
+        if self._jumping(now):
+            return False
+        if self.armed and obs["lead_x"] <= trig_x:
+            act.jump()
+            self.last_jump_t = now
+            self.in_air = True
+            self.armed = False  # disarm until this obstacle passes
+            return True
+        return False
+
+    def step(self, obs, now, act):
+        self._update_airborne_and_arm(obs, now)
+        self._maybe_jump(obs, now, act)
+
+        # Fast drop (only if airborne, only while an obstacle is in view)
+        if self.in_air and obs is not None:
+            safe_to_drop = (now - self.last_jump_t) > MIN_AIR_TIME and (
+                now - self.last_drop_t
+            ) > (self.drop_hold + 0.02)
+            if safe_to_drop:
+                act.fast_drop(self.drop_hold)
+                self.last_drop_t = now + self.drop_hold  # fast_drop() holds the key
+
+
+class LandBehindPolicy(ReactivePolicy):
+    """
+    even-better-dino: same jump rule, but "lock" onto the obstacle we jumped for,
+    keep its trailing edge fresh while it is visible, and fast-drop ONCE as soon
+    as that edge is behind SAFE_CLEAR_X, so we land as early as possible behind it.
+    """
+
+    def __init__(self, small_jump_x=156, large_jump_x=160, drop_hold=0.1, verbose=False):
+        super().__init__(small_jump_x, large_jump_x, drop_hold, verbose)
+        self.track = None
+
+    def start_obstacle_tracking(self, obs, now):
+        """Call this RIGHT WHEN YOU JUMP."""
+        self.track = {
+            "active": True,
+            "trail_x_last": obs["trail_x"],
+            "jump_t": now,
+            "drop_done": False,
+        }
+
+    def update_obstacle_tracking(self, obs):
+        """If detection flickers, we keep the last known trail_x."""
+        track = self.track
+        if track is not None and track.get("active", False) and obs is not None:
+            track["trail_x_last"] = obs["trail_x"]
+
+    def should_fast_drop_to_land_behind(self, now):
+        """
+        Safe/useful to drop only when:
+          1) We've been airborne long enough (MIN_AIR_TIME)
+          2) The obstacle's trailing edge is behind SAFE_CLEAR_X
+          3) We haven't already done the drop for this obstacle
+        """
+        track = self.track
+        if track is None or not track.get("active", False):
+            return False
+        if track.get("drop_done", False):
+            return False
+        if (now - track["jump_t"]) < MIN_AIR_TIME:
+            return False
+        return track["trail_x_last"] < self.safe_clear_x
+
+    def step(self, obs, now, act):
+        self._update_airborne_and_arm(obs, now)
+        self.update_obstacle_tracking(obs)
+
+        if self._maybe_jump(obs, now, act):
+            self.start_obstacle_tracking(obs, now)
+
+        if self.in_air and self.should_fast_drop_to_land_behind(now):
+            act.fast_drop(self.drop_hold)
+            self.track["drop_done"] = True
+            self.track["active"] = False  # stop tracking after we fast-drop once
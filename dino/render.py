@@ -0,0 +1,262 @@
+from functools import lru_cache
+
+import numpy as np
+import cv2
+
+from .detect import LOOK_H, LOOK_W, LOOK_X_REL, LOOK_Y_OFF, get_roi
+
+WINDOW_NAME = "game_render"
+STRIP_WINDOW_NAME = "just showing"
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+TEXT_CACHE_SIZE = 64  # distinct (text, scale, thickness) masks kept; fixed strings only
+
+
+# =============================================================================
+# CACHED OVERLAY PIECES
+# =============================================================================
+class StaticLayer:
+    """
+    Overlay elements that never move (ROI rects) and fixed-string text (state
+    lines). Rasterised once per (frame shape, key) into a (canvas, mask) pair
+    cropped to their bounding box, then pasted onto every frame with a single
+    masked copy. key picks one of the few variants a renderer has, e.g. which
+    state line is showing; variants are built the first time they're pasted.
+
+    layout(shape, key) -> (
+        [((x1, y1), (x2, y2), color, thickness), ...],  # rects
+        [(text, org, scale, color, thickness), ...],  # texts, drawn like put_text()
+    )
+    """
+
+    def __init__(self, layout):
+        self.layout = layout
+        self.shape = None
+        self.layers = {}  # key -> (box, canvas, mask); box None = nothing to paste
+
+    def invalidate(self):
+        """Rebuild every variant on the next paste (the layout changed)."""
+        self.layers.clear()
+
+    def _build(self, shape, key):
+        h, w = shape[:2]
+        canvas = np.zeros((h, w, 3), np.uint8)
+        mask = np.zeros((h, w), np.uint8)
+        rects, texts = self.layout(shape, key)
+        for p1, p2, color, thickness in rects:
+            cv2.rectangle(canvas, p1, p2, color, thickness)
+            cv2.rectangle(mask, p1, p2, 1, thickness)
+        for text, org, scale, color, thickness in texts:
+            put_text(canvas, text, org, scale, color, thickness, mask=mask)
+
+        ys, xs = np.nonzero(mask)
+        if ys.size == 0:
+            return None, None, None
+        y0, y1, x0, x1 = int(ys.min()), int(ys.max()) + 1, int(xs.min()), int(xs.max()) + 1
+        return (y0, y1, x0, x1), canvas[y0:y1, x0:x1].copy(), mask[y0:y1, x0:x1].copy()
+
+    def paste(self, game_frame, key=None):
+        if game_frame.shape != self.shape:
+            self.layers.clear()
+            self.shape = game_frame.shape
+        layer = self.layers.get(key)
+        if layer is None:
+            layer = self.layers[key] = self._build(game_frame.shape, key)
+        box, canvas, mask = layer
+        if box is not None:
+            y0, y1, x0, x1 = box
+            cv2.copyTo(canvas, mask, game_frame[y0:y1, x0:x1])
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _text_sprite(text, scale, thickness):
+    """
+    Renders `text` once into a 0/1 mask. Returns (mask, dx, dy) where (dx, dy) is
+    where the putText origin (baseline-left) sits inside the mask.
+    """
+    (tw, th), base = cv2.getTextSize(text, FONT, scale, thickness)
+    dx, dy = thickness, th + thickness
+    mask = np.zeros((th + base + 2 * thickness, tw + 2 * thickness), np.uint8)
+    cv2.putText(mask, text, (dx, dy), FONT, scale, 255, thickness, cv2.LINE_AA)
+    return (mask >= 128).astype(np.uint8), dx, dy
+
+
+@lru_cache(maxsize=None)
+def _color_tile(color, h, w):
+    """Solid-color source for masked copies (sliced down to each sprite's size)."""
+    tile = np.empty((h, w, 3), np.uint8)
+    tile[:] = color
+    return tile
+
+
+def put_text(game_frame, text, org, scale, color, thickness, mask=None):
+    """
+    Drop-in for cv2.putText(..., FONT, ...) that pastes a cached sprite. Only for
+    strings from a small fixed set; per-frame values go through draw_text().
+    mask (frame-sized, uint8): also mark the text's pixels in it with 1.
+    """
+    sprite_mask, dx, dy = _text_sprite(text, scale, thickness)
+    H, W = game_frame.shape[:2]
+    patch = _color_tile(color, H, W)
+    x0, y0 = org[0] - dx, org[1] - dy
+    cx0, cy0 = max(x0, 0), max(y0, 0)
+    cx1, cy1 = min(x0 + sprite_mask.shape[1], W), min(y0 + sprite_mask.shape[0], H)
+    if cx1 <= cx0 or cy1 <= cy0:
+        return
+    sx, sy = cx0 - x0, cy0 - y0
+    sw, sh = cx1 - cx0, cy1 - cy0
+    sprite = sprite_mask[sy : sy + sh, sx : sx + sw]
+    cv2.copyTo(patch[sy : sy + sh, sx : sx + sw], sprite, game_frame[cy0:cy1, cx0:cx1])
+    if mask is not None:
+        mask[cy0:cy1, cx0:cx1] |= sprite
+
+
+def draw_vline(game_frame, x, color):
+    """
+    Full-height cv2.line(..., thickness=2) at x (same pixels: columns x-1..x+1) as
+    a slice fill; cv2 draws thick lines as polygons, ~7 us each.
+    """
+    game_frame[:, max(x - 1, 0) : max(x + 2, 0)] = color
+
+
+def draw_text(game_frame, text, org, scale, color, thickness):
+    """
+    Text that changes nearly every frame (edge x, widths): plain putText without
+    LINE_AA. A sprite would miss the cache almost every frame, and a miss costs
+    about twice an anti-aliased putText.
+    """
+    cv2.putText(game_frame, text, org, FONT, scale, color, thickness)
+
+
+class _Windows:
+    """imshow + waitKey, with window properties set once per window (not per frame)."""
+
+    def __init__(self, show=True):
+        self.show = show
+        self.opened = set()
+
+    def imshow(self, name, img):
+        if not self.show:
+            return
+        if name not in self.opened:
+            cv2.namedWindow(name)
+            cv2.setWindowProperty(name, cv2.WND_PROP_TOPMOST, 1)
+            self.opened.add(name)
+        cv2.imshow(name, img)
+
+    def keep_going(self):
+        """
+        False when the user pressed q. pollKey() pumps window events without the
+        >= 1 ms block waitKey(1) costs every frame (older OpenCV: waitKey(1)).
+        """
+        if not self.show:
+            return True
+        key = cv2.pollKey() if hasattr(cv2, "pollKey") else cv2.waitKey(1)
+        return not (key & 0xFF == ord("q"))
+
+    def close(self):
+        if self.opened:
+            cv2.destroyAllWindows()
+            self.opened.clear()
+
+
+# =============================================================================
+# RENDERERS
+# =============================================================================
+class StripRenderer:
+    """
+    opencv-dino-game overlay: the strip itself, its rect and HIT=.
+    show=False composes the overlay without opening windows (benchmarks).
+    """
+
+    def __init__(self, show=True):
+        self.windows = _Windows(show)
+        self.static = StaticLayer(self._static_layout)
+        self.rect = None
+        for hit in (False, True):  # font init + sprites up front, not on frame 1
+            _text_sprite(f"HIT={hit}", 0.7, 2)
+
+    def _static_layout(self, shape, hit):
+        x1, y1, x2, y2 = self.rect
+        rects = [((x1, y1), (max(x1, x2 - 1), max(y1, y2 - 1)), (0, 0, 255), 2)]
+        return rects, [(f"HIT={hit}", (10, 25), 0.7, (0, 0, 255), 2)]
+
+    def draw(self, game_frame, obs, policy):
+        """Returns False when the user asked to quit."""
+        self.windows.imshow(STRIP_WINDOW_NAME, obs["gray"])
+
+        if obs["rect"] != self.rect:
+            self.rect = obs["rect"]
+            self.static.invalidate()
+        self.static.paste(game_frame, obs["hit"])
+
+        self.windows.imshow(WINDOW_NAME, game_frame)
+        return self.windows.keep_going()
+
+    def close(self):
+        self.windows.close()
+
+
+class BlockRenderer:
+    """
+    better-dino / even-better-dino overlay: lookahead rect, edges, trigger, state.
+    show=False composes the overlay without opening windows (benchmarks).
+    """
+
+    def __init__(self, show=True):
+        self.windows = _Windows(show)
+        self.static = StaticLayer(self._static_layout)
+        self.rect = None  # lookahead rect of the last obs (None = fixed LOOK_W one)
+        _text_sprite("no obstacle", 0.6, 2)  # font init + fixed sprites up front
+        for armed in (False, True):
+            for in_air in (False, True):
+                _text_sprite(f"armed={armed} in_air={in_air}", 0.6, 2)
+
+    def _static_layout(self, shape, key):
+        """key = (armed, in_air, no obstacle in view): the state lines that don't change."""
+        armed, in_air, empty = key
+        if self.rect is None:
+            blank = np.empty(shape[:2], np.uint8)
+            _, (x1, y1, x2, y2) = get_roi(blank, LOOK_X_REL, LOOK_W, LOOK_Y_OFF, LOOK_H)
+        else:
+            x1, y1, x2, y2 = self.rect
+        rects = [((x1, y1), (x2 - 1, y2 - 1), (255, 0, 0), 2)]
+        texts = [(f"armed={armed} in_air={in_air}", (10, 25), 0.6, (0, 0, 255), 2)]
+        if empty:
+            texts.append(("no obstacle", (10, 50), 0.6, (255, 0, 0), 2))
+        return rects, texts
+
+    def draw(self, game_frame, obs, policy):
+        """Returns False when the user asked to quit."""
+        # Lookahead rect + state lines (cached; rebuilt when a LookaheadWindow resizes it)
+        if obs is not None and obs["rect"] != self.rect:
+            self.rect = obs["rect"]
+            self.static.invalidate()
+        self.static.paste(game_frame, (policy.armed, policy.in_air, obs is None))
+
+        # Trigger / obstacle edges (dynamic)
+        if obs is not None:
+            trig_x = policy.trigger_x_for_width(obs["width_px"])
+            draw_vline(game_frame, obs["lead_x"], (0, 255, 0))
+            draw_vline(game_frame, obs["trail_x"], (0, 255, 255))
+            draw_vline(game_frame, trig_x, (0, 0, 255))
+            draw_text(
+                game_frame, f"w={obs['width_px']} trig={trig_x}", (10, 50), 0.6, (255, 0, 0), 2
+            )
+
+        # Tracking info (land-behind policy only)
+        track = getattr(policy, "track", None)
+        if track is not None and track.get("active", False):
+            draw_text(
+                game_frame,
+                f"track trail_x_last={track['trail_x_last']}",
+                (10, 75),
+                0.55,
+                (0, 0, 255),
+                2,
+            )
+
+        self.windows.imshow(WINDOW_NAME, game_frame)
+        return self.windows.keep_going()
+
+    def close(self):
+        self.windows.close()
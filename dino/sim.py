@@ -0,0 +1,245 @@
+import math
+
+import numpy as np
+
+from .actuate import KEY_PAUSE_S
+from .sprites import DINO_X, FRAME_H, FRAME_W, GROUND_Y, SPRITES, draw_frame, stamp
+
+# =============================================================================
+# Closed-loop stand-in for the browser: a frame-stepped dino game that is both
+# the capture (grab() renders the next frame) and the actuator (jump/fast_drop),
+# on its own clock, so policies can be compared deterministically and faster
+# than real time. Obstacles are cacti only (no birds), drawn with the
+# golden-frame sprites.
+#
+# The dino follows its own port of Chrome's Trex jump code, key down/up events
+# included, NOT the planner's arc table, so plan-bench can catch errors in that
+# model. Ported from memory of the Runner source, not checked against the live
+# game.
+#
+# Geometry: the game frame starts ~46 px into Chrome's canvas, so the dino
+# (canvas x 50) sits at DINO_X, left of the lookahead ROI (which must not see
+# it). Bot timing: key calls block the bot like PyAutoGuiActuator's do.
+# =============================================================================
+
+# ----------------- SIM DEFAULTS (Chrome Runner-ish) -----------------
+GAME_FPS = 60
+START_SPEED = 6.0  # px per game frame
+ACCELERATION = 0.001  # px per game frame, per game frame
+MAX_SPEED = 13.0
+MIN_GAP = 120  # Chrome: gap >= width * speed + MIN_GAP * GAP_COEFFICIENT
+GAP_COEFFICIENT = 0.6
+MAX_GAP_COEFFICIENT = 1.5
+MULTIPLE_SPEED = {"small": 4, "large": 7}  # groups of 2-3 only from this speed on
+HIT_X = 60  # collisions are only checked left of this x (the dino lives there)
+INPUT_LATENCY_S = 0.03  # key event -> the game sees it (pyautogui + browser)
+
+# ----------------- TREX (Chrome Trex.config; canvas y grows downwards) -----------------
+GROUND_POS = 93  # groundYPos: 150 px canvas - 47 px dino - 10 px bottom pad
+INITIAL_JUMP_VELOCITY = -10  # startJump(): minus currentSpeed / 10 on top
+GRAVITY = 0.6
+MIN_JUMP_HEIGHT = 30  # above this a jump-key release cuts the rise (endJump)
+MAX_JUMP_HEIGHT = 30  # yPos above which the rise is cut anyway
+DROP_VELOCITY = -5  # endJump(): upward velocity capped to this
+SPEED_DROP_VELOCITY = 1  # setSpeedDrop(): velocity set to this (downwards) ...
+SPEED_DROP_COEFFICIENT = 3  # ... and moves 3x as fast while DOWN is held
+
+
+def _js_round(x):
+    """Math.round: halves round up (towards +inf), unlike Python's round()."""
+    return math.floor(x + 0.5)
+
+
+class Trex:
+    """
+    Chrome's Trex jump state, one update() per game frame. Key handling follows
+    Runner.onKeyDown / onKeyUp: jump only from the ground and not ducking; jump
+    release = endJump(); DOWN in the air = speed drop, on the ground = duck;
+    DOWN release ends both.
+    """
+
+    def __init__(self):
+        self.y_pos = GROUND_POS
+        self.jump_velocity = 0.0
+        self.jumping = False
+        self.ducking = False
+        self.speed_drop = False
+        self.reached_min_height = False
+        self.min_jump_height = GROUND_POS - MIN_JUMP_HEIGHT
+
+    @property
+    def height(self):
+        """px above the ground."""
+        return GROUND_POS - self.y_pos
+
+    def key(self, name, pressed, speed):
+        if name == "jump":
+            if pressed and not self.jumping and not self.ducking:
+                self.jumping = True
+                self.jump_velocity = INITIAL_JUMP_VELOCITY - speed / 10
+                self.reached_min_height = False
+                self.speed_drop = False
+            elif not pressed:
+                self._end_jump()
+        elif pressed:
+            if self.jumping:
+                self.speed_drop = True
+                self.jump_velocity = SPEED_DROP_VELOCITY
+            else:
+                self.ducking = True
+        else:
+            self.speed_drop = False
+            self.ducking = False
+
+    def _end_jump(self):
+        if self.reached_min_height and self.jump_velocity < DROP_VELOCITY:
+            self.jump_velocity = DROP_VELOCITY
+
+    def update(self):
+        if not self.jumping:
+            return
+        k = SPEED_DROP_COEFFICIENT if self.speed_drop else 1
+        self.y_pos += _js_round(self.jump_velocity * k)
+        self.jump_velocity += GRAVITY
+        if self.y_pos < self.min_jump_height or self.speed_drop:
+            self.reached_min_height = True
+        if self.y_pos < MAX_JUMP_HEIGHT or self.speed_drop:
+            self._end_jump()
+        if self.y_pos > GROUND_POS:  # landed
+            self.y_pos = GROUND_POS
+            self.jump_velocity = 0.0
+            self.jumping = False
+            self.ducking = False
+            self.speed_drop = False
+
+
+class SimGame:
+    """
+    grab() advances the game by frames_per_grab frames (our capture rate vs the
+    game's 60 fps) and returns the new frame; None once the dino has crashed.
+    Key presses act latency frames after the frame they were made on, and block
+    the bot like PyAutoGuiActuator does: key_pause_s after every key call (plus
+    the DOWN hold), so its next grab() comes that much later.
+    gap_scale < 1 packs obstacles closer than Chrome does (close pairs).
+    """
+
+    def __init__(
+        self,
+        seed=0,
+        gap_scale=1.0,
+        frames_per_grab=1,
+        latency_s=INPUT_LATENCY_S,
+        key_pause_s=KEY_PAUSE_S,
+        speed=START_SPEED,
+        night=False,
+    ):
+        self.rng = np.random.default_rng(seed)
+        self.gap_scale = gap_scale
+        self.frames_per_grab = frames_per_grab
+        self.latency_s = latency_s
+        self.key_pause_s = key_pause_s
+        self.speed = speed
+        self.night = night
+
+        self.frame = 0
+        self.next_frame = 0
+        self.obstacles = []  # [{"sprite", "x" (float, left), "n", "w"}]
+        self.spawn_x = FRAME_W  # where the next group starts
+        self.trex = Trex()
+        self.pending = []  # [(frame, key, pressed)], applied in order
+        self.crashed = False
+        self.cleared = 0
+        self.distance = 0.0
+        self.actions = []
+
+    # ----------------- actuator -----------------
+    def _key_at(self, delay_s, key, pressed):
+        """The game handles the event before the first frame at least delay_s from now."""
+        frame = self.frame + max(1, math.ceil(delay_s * GAME_FPS - 1e-9))
+        self.pending.append((frame, key, pressed))
+
+    def _block(self, s):
+        """The bot is stuck in a key call for s: its next grab comes strictly after that."""
+        if s > 0:
+            self.next_frame = max(self.next_frame, self.frame + math.floor(s * GAME_FPS) + 1)
+
+    def jump(self):
+        """A tap (pyautogui.press): down and up arrive together."""
+        self._key_at(self.latency_s, "jump", True)
+        self._key_at(self.latency_s, "jump", False)
+        self._block(self.key_pause_s)
+        self.actions.append("jump")
+
+    def fast_drop(self, hold_s=0.04):
+        """keyDown (+ pause), sleep(hold_s), keyUp (+ pause)."""
+        self._key_at(self.latency_s, "down", True)
+        self._key_at(self.latency_s + self.key_pause_s + hold_s, "down", False)
+        self._block(2 * self.key_pause_s + hold_s)
+        self.actions.append("drop")
+
+    # ----------------- capture -----------------
+    def clock(self):
+        """Game time of the frame the next grab() returns."""
+        return self.next_frame / GAME_FPS
+
+    def grab(self):
+        if self.crashed:
+            return None
+        while self.frame < self.next_frame:
+            self._tick()
+            if self.crashed:
+                return None
+        self.next_frame += self.frames_per_grab
+        return draw_frame(self._obstacle_mask(0, FRAME_W), self.night, GROUND_Y - self.height)
+
+    def close(self):
+        pass
+
+    # ----------------- game -----------------
+    @property
+    def height(self):
+        return self.trex.height
+
+    def _spawn(self):
+        while self.spawn_x < FRAME_W + 200:
+            sprite = "large" if self.rng.random() < 0.4 else "small"
+            n = int(self.rng.integers(1, 4))
+            if self.speed < MULTIPLE_SPEED[sprite]:
+                n = 1
+            w = SPRITES[sprite][0] * n
+            self.obstacles.append({"sprite": sprite, "x": float(self.spawn_x), "n": n, "w": w})
+            min_gap = round(w * self.speed + MIN_GAP * GAP_COEFFICIENT)
+            gap = self.rng.uniform(min_gap, min_gap * MAX_GAP_COEFFICIENT) * self.gap_scale
+            self.spawn_x += w + max(gap, w)
+
+    def _tick(self):
+        self.frame += 1
+        due = [p for p in self.pending if p[0] <= self.frame]
+        self.pending = [p for p in self.pending if p[0] > self.frame]
+        for _, key, pressed in due:
+            self.trex.key(key, pressed, self.speed)
+        self.trex.update()
+
+        self.distance += self.speed
+        for ob in self.obstacles:
+            ob["x"] -= self.speed
+        passed = [ob for ob in self.obstacles if ob["x"] + ob["w"] < 0]
+        self.cleared += len(passed)
+        self.obstacles = [ob for ob in self.obstacles if ob["x"] + ob["w"] >= 0]
+        self.spawn_x -= self.speed
+        self.speed = min(self.speed + ACCELERATION, MAX_SPEED)
+        self._spawn()
+
+        dino = np.zeros((FRAME_H, HIT_X), bool)
+        stamp(dino, "dino", DINO_X, GROUND_Y - self.height)
+        self.crashed = bool((dino & self._obstacle_mask(0, HIT_X)).any())
+
+    def _obstacle_mask(self, x0, x1):
+        mask = np.zeros((FRAME_H, x1 - x0), bool)
+        for ob in self.obstacles:
+            x = int(round(ob["x"]))
+            if x >= x1 or x + ob["w"] <= x0:
+                continue
+            for i in range(ob["n"]):
+                stamp(mask, ob["sprite"], x - x0 + i * SPRITES[ob["sprite"]][0], GROUND_Y)
+        return mask
@@ -0,0 +1,109 @@
+from functools import lru_cache
+
+import numpy as np
+import cv2
+
+# =============================================================================
+# Synthetic Chrome-dino frames: the golden-frame corpus and the simulator draw
+# with these, so both match what the detectors see on screen.
+# =============================================================================
+
+# ----------------- FRAME GEOMETRY (matches DINO_WIDTH x DINO_HEIGHT) -----------------
+FRAME_W = 600
+FRAME_H = 155
+GROUND_Y = 120  # obstacles stand on this row (exclusive bottom edge)
+
+BG = 247  # Chrome dino day palette
+FG = 83
+CLOUD = 218
+
+# Sprites as (x0, y0, x1, y1) rectangles relative to the sprite's top-left corner.
+SPRITES = {
+    "small": (
+        17,
+        35,
+        [
+            (6, 0, 11, 35),  # trunk
+            (1, 8, 4, 20),  # left arm
+            (1, 17, 6, 20),
+            (13, 5, 16, 18),  # right arm
+            (11, 15, 16, 18),
+        ],
+    ),
+    "large": (
+        25,
+        50,
+        [
+            (8, 0, 17, 50),
+            (2, 10, 6, 28),
+            (2, 24, 8, 28),
+            (19, 6, 23, 24),
+            (17, 20, 23, 24),
+        ],
+    ),
+    "bird": (
+        42,
+        30,
+        [
+            (0, 6, 12, 14),  # head + beak
+            (10, 10, 36, 20),  # body
+            (36, 12, 42, 16),  # tail
+            (14, 0, 26, 10),  # wing up
+        ],
+    ),
+    "dino": (
+        44,
+        47,
+        [
+            (22, 0, 44, 16),
+            (10, 14, 34, 36),
+            (0, 16, 10, 28),
+            (14, 36, 20, 47),
+            (26, 36, 32, 47),
+        ],
+    ),
+}
+
+
+DINO_X = 4  # where the dino sprite sits in the game frame
+
+
+def stamp(mask, sprite, x, bottom_y):
+    """Sets the pixels of `sprite` (bottom edge at bottom_y, left edge at x) in mask."""
+    w, h, rects = SPRITES[sprite]
+    top = bottom_y - h
+    for rx0, ry0, rx1, ry1 in rects:
+        y0 = max(top + ry0, 0)
+        y1 = min(top + ry1, mask.shape[0])
+        x0 = max(x + rx0, 0)
+        x1 = min(x + rx1, mask.shape[1])
+        if y1 > y0 and x1 > x0:
+            mask[y0:y1, x0:x1] = True
+
+
+@lru_cache(maxsize=1)
+def _background():
+    gray = np.full((FRAME_H, FRAME_W), BG, np.uint8)
+
+    # Background clutter that must NOT be detected
+    cv2.ellipse(gray, (420, 30), (23, 7), 0, 0, 360, CLOUD, 1)
+    cv2.ellipse(gray, (120, 45), (23, 7), 0, 0, 360, CLOUD, 1)
+    cv2.putText(gray, "00412", (520, 18), cv2.FONT_HERSHEY_SIMPLEX, 0.45, FG, 1)
+    gray[GROUND_Y + 1, :] = FG
+    rng = np.random.default_rng(7)
+    for x in rng.integers(0, FRAME_W - 3, 40):
+        gray[GROUND_Y + 4 + (x % 6), x : x + 2] = FG
+    return gray
+
+
+def draw_frame(obstacle, night=False, dino_bottom=GROUND_Y):
+    """BGR game frame: background, the dino (feet at dino_bottom) and the obstacle mask."""
+    gray = _background().copy()
+    dino = np.zeros_like(obstacle)
+    stamp(dino, "dino", DINO_X, dino_bottom)
+    gray[dino] = FG
+    gray[obstacle] = FG
+
+    if night:
+        gray = 255 - gray
+    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
@@ -0,0 +1,106 @@
+"""
+The three bot behaviours as stage factories. Nothing heavy is imported until a
+factory actually runs, so `import dino.strategies` stays cheap.
+"""
+
+STRATEGIES = ("strip", "better", "even-better", "plan")
+
+
+def build_detector(name, invert=False):
+    from . import detect
+
+    if name == "strip":
+        return detect.StripDetector()
+    return detect.BlockDetector(invert=invert, all_blocks=name == "plan")
+
+
+def build_policy(name, verbose=False):
+    from . import policy
+
+    if name == "strip":
+        return policy.StripPolicy()
+    if name == "better":
+        return policy.ReactivePolicy(verbose=verbose)
+    if name == "even-better":
+        return policy.LandBehindPolicy(verbose=verbose)
+    if name == "plan":
+        from . import plan
+
+        return plan.PlannerPolicy(verbose=verbose)
+    raise ValueError(f"unknown strategy {name!r} (expected one of {STRATEGIES})")
+
+
+def build_lookahead(name, detector, policy, capture=None, roi_grab=False):
+    """
+    Speed-adaptive ROI for the block strategies (None for strip). The trigger
+    rules only need a block in view by their trigger line; the planner also has
+    to see the next block before it decides on a drop, i.e. by the arc's peak.
+    """
+    if name == "strip":
+        return None
+    from . import lookahead
+
+    if name == "plan":
+        from . import plan
+
+        reaction_s = (plan.peak_frame() + policy.planner.latency + 2) / plan.GAME_FPS
+        return lookahead.LookaheadWindow(
+            detector,
+            plan.DINO_FRONT_X,
+            reaction_s,
+            capture,
+            roi_grab,
+            estimator=policy.estimator,
+        )
+    return lookahead.LookaheadWindow(
+        detector, policy.max_trigger_x, capture=capture, roi_grab=roi_grab
+    )
+
+
+def build_renderer(name, show=True):
+    from . import render
+
+    if name == "strip":
+        return render.StripRenderer(show=show)
+    return render.BlockRenderer(show=show)
+
+
+def key_pause_s(name):
+    """
+    How long each key call blocks the bot. The trigger-line bots keep pyautogui's
+    default pause, like the original scripts: the frame after a jump only comes in
+    after LANDED_AFTER, so their 0.09 s fast-drop window never opens on a real
+    screen. The planner's arc tables hold DOWN for exactly DROP_HOLD_S and it needs
+    every frame in the air, so it presses without one.
+    """
+    from . import actuate
+
+    return 0.0 if name == "plan" else actuate.KEY_PAUSE_S
+
+
+def build_actuator(name, dry_run=False):
+    from . import actuate
+
+    if dry_run:
+        return actuate.NullActuator()
+    return actuate.PyAutoGuiActuator(pause_s=key_pause_s(name))
+
+
+def build_sim(name, seed=0, gap_scale=1.0, frames_per_grab=1):
+    """Simulated game: capture AND actuator (and clock) in one object."""
+    from . import sim
+
+    return sim.SimGame(
+        seed=seed,
+        gap_scale=gap_scale,
+        frames_per_grab=frames_per_grab,
+        key_pause_s=key_pause_s(name),
+    )
+
+
+def build_capture(replay=None, copy_frames=True):
+    from . import capture
+
+    if replay:
+        return capture.ReplayCapture(replay)
+    return capture.MssCapture(copy_frames=copy_frames)
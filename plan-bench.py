@@ -0,0 +1,189 @@
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from dino.detect import LOOK_H, LOOK_W
+from dino.engine import Engine
+from dino.plan import PLAN_BUDGET_US
+from dino.strategies import build_detector, build_lookahead, build_policy, build_sim
+
+# =============================================================================
+# Closed-loop comparison of the decision policies on the simulated game.
+#
+#   python plan-bench.py                 # the gate: 5 seeds, both ROIs, gaps 1.0 and 0.7
+#   python plan-bench.py --gap 0.6       # obstacles closer together than Chrome
+#   python plan-bench.py --fps 30        # bot sees every 2nd game frame
+#   python plan-bench.py --roi fixed     # only play with the LOOK_W-wide ROI
+#
+# Same seeds => same obstacle sequence for every strategy. Prints how far each
+# got, ROI pixels detected per frame, detection us/frame with the fixed and the
+# adaptive ROI (both run on every frame, whichever one plays), and for the
+# planner what planning cost per frame (vs PLAN_BUDGET_US). Exits non-zero if
+# plan crashes in any game, averages over the budget or goes over it on more
+# than MAX_OVER_BUDGET of its frames (single frames over it are mostly the
+# scheduler, not the search).
+# better / even-better are only reported: they lose close pairs (gap 0.7) by design.
+# =============================================================================
+
+STRATEGIES = ("better", "even-better", "plan")
+ROIS = ("adaptive", "fixed")
+GATE_GAPS = (1.0, 0.7)  # Chrome's spacing, and close pairs (what the planner is for)
+GAME_FPS = 60
+MAX_OVER_BUDGET = 0.01  # share of planned frames
+
+
+class RoiCost:
+    """
+    Detector that runs both ROIs on every frame: the fixed LOOK_W one, and the
+    adaptive one plus its window update. Each is timed on the same frames,
+    alternating which goes first. The policy gets the `roi` one's obs.
+    """
+
+    def __init__(self, strategy, policy, roi, clock):
+        self.fixed = build_detector(strategy)
+        self.adaptive = build_detector(strategy)
+        self.window = build_lookahead(strategy, self.adaptive, policy)
+        self.roi = roi
+        self.clock = clock
+        self.us = {"fixed": 0.0, "adaptive": 0.0}
+        self.frames = 0
+
+    def _fixed(self, frame):
+        t0 = time.perf_counter()
+        obs = self.fixed(frame)
+        self.us["fixed"] += (time.perf_counter() - t0) * 1e6
+        return obs
+
+    def _adaptive(self, frame):
+        t0 = time.perf_counter()
+        obs = self.adaptive(frame)
+        self.window.update(frame, obs, self.clock())
+        self.us["adaptive"] += (time.perf_counter() - t0) * 1e6
+        return obs
+
+    def __call__(self, frame):
+        self.frames += 1
+        if self.frames % 2:
+            fixed, adaptive = self._fixed(frame), self._adaptive(frame)
+        else:
+            adaptive, fixed = self._adaptive(frame), self._fixed(frame)
+        return fixed if self.roi == "fixed" else adaptive
+
+
+def run(strategy, seed, gap, frames_per_grab, max_frames, roi):
+    game = build_sim(strategy, seed, gap, frames_per_grab)
+    policy = build_policy(strategy)
+    detector = RoiCost(strategy, policy, roi, game.clock)
+    engine = Engine(game, detector, policy, game, clock=game.clock)
+    engine.run(max_frames=max_frames)
+    stats = policy.plan_stats() if hasattr(policy, "plan_stats") else None
+    other = "adaptive" if roi == "fixed" else "fixed"
+    n = max(engine.frames, 1)
+    window = detector.window.roi_stats()
+    return {
+        "crashed": game.crashed,
+        "frames": game.frame,
+        "cleared": game.cleared,
+        "us": (engine.busy_s * 1e6 - detector.us[other]) / n,  # without the shadow ROI
+        "fixed_us": detector.us["fixed"] / n,
+        "adaptive_us": detector.us["adaptive"] / n,
+        "px": LOOK_W * LOOK_H if roi == "fixed" else window["detect_px"],
+        "short": 0 if roi == "fixed" else window["short"],
+        "plan": stats,
+    }
+
+
+def main():
+    p = argparse.ArgumentParser(description="Dino policy comparison on the simulator")
+    p.add_argument("--seeds", type=int, default=5, help="Games per strategy")
+    p.add_argument(
+        "--gap",
+        type=float,
+        action="append",
+        help=f"Obstacle gap scale (1 = Chrome); default {' and '.join(map(str, GATE_GAPS))}",
+    )
+    p.add_argument("--fps", type=int, default=60, help="Bot frames per second (<= 60)")
+    p.add_argument(
+        "--seconds", type=float, default=60.0, help="Stop a game after this much game time"
+    )
+    p.add_argument("--strategy", choices=STRATEGIES, action="append", help="Only these")
+    p.add_argument(
+        "--roi",
+        choices=ROIS,
+        action="append",
+        help="ROI the policy plays with (both are timed either way); default both",
+    )
+    args = p.parse_args()
+
+    frames_per_grab = max(1, round(GAME_FPS / args.fps))
+    max_frames = int(args.seconds * GAME_FPS / frames_per_grab)
+
+    print(
+        f"{'strategy':<12} {'roi':<8} {'gap':>4} {'crashes':>8} {'cleared':>8} {'game s':>7} "
+        f"{'us/frame':>9} {'px/frame':>9} {'short':>6} {'fixed us':>9} {'adapt us':>9} "
+        f"{'plan us':>8} {'plan max':>9} {'cuts':>5} {'over':>5} {'part':>5} {'fallbk':>7} "
+        f"{'fb us':>6}"
+    )
+    failures = []
+    for gap in args.gap or GATE_GAPS:
+        for strategy in args.strategy or STRATEGIES:
+            for roi in args.roi or ROIS:
+                failures += report(strategy, roi, gap, args.seeds, frames_per_grab, max_frames)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        return 1
+    print("OK")
+    return 0
+
+
+def report(strategy, roi, gap, seeds, frames_per_grab, max_frames):
+    """Plays the seeds, prints one row; returns the gate failures (plan only)."""
+    rows = [run(strategy, seed, gap, frames_per_grab, max_frames, roi) for seed in range(seeds)]
+    line = (
+        f"{strategy:<12} {roi:<8} {gap:>4} {sum(r['crashed'] for r in rows):>8} "
+        f"{np.mean([r['cleared'] for r in rows]):>8.1f} "
+        f"{np.mean([r['frames'] for r in rows]) / GAME_FPS:>7.1f} "
+        f"{np.mean([r['us'] for r in rows]):>9.1f} "
+        f"{np.mean([r['px'] for r in rows]):>9.0f} "
+        f"{sum(r['short'] for r in rows):>6}"
+        f" {np.mean([r['fixed_us'] for r in rows]):>9.1f}"
+        f" {np.mean([r['adaptive_us'] for r in rows]):>9.1f}"
+    )
+    plans = [r["plan"] for r in rows if r["plan"] is not None]
+    if plans:
+        fallbacks = sum(s["fallback"] for s in plans)
+        fallback_us = sum(s["fallback_mean_us"] * s["fallback"] for s in plans)
+        fallback_us /= max(fallbacks, 1)
+        line += (
+            f" {np.mean([s['mean_us'] for s in plans]):>8.1f}"
+            f" {max(s['max_us'] for s in plans):>9.1f}"
+            f" {sum(s['budget_cut'] for s in plans):>5}"
+            f" {sum(s['over_budget'] for s in plans):>5}"
+            f" {sum(s['partial'] for s in plans):>5}"
+            f" {fallbacks:>7}"
+            f" {fallback_us:>6.1f}"
+        )
+    print(line)
+
+    if strategy != "plan":
+        return []
+    failures = []
+    where = f"plan (--roi {roi} --gap {gap})"
+    crashes = [seed for seed, r in enumerate(rows) if r["crashed"]]
+    if crashes:
+        failures.append(f"{where} crashed (seeds {crashes})")
+    mean_us = np.mean([s["mean_us"] for s in plans])
+    if mean_us > PLAN_BUDGET_US:
+        failures.append(f"{where} {mean_us:.1f} us/frame > budget {PLAN_BUDGET_US} us")
+    over = sum(s["over_budget"] for s in plans) / max(sum(s["plans"] for s in plans), 1)
+    if over > MAX_OVER_BUDGET:
+        failures.append(f"{where} over budget on {over:.1%} of frames > {MAX_OVER_BUDGET:.0%}")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+# =============================================================================
+# Import + startup time of the bot engine, each measured in a fresh interpreter.
+#
+#   python startup-bench.py            # report, fail if `import dino` > --max-import-ms
+#   python startup-bench.py --runs 10
+#
+# The old scripts imported numpy/cv2/mss/pyautogui eagerly and then slept a
+# fixed 1-2 s before the first frame; those are printed for comparison. (On the
+# screen the bot now waits for you to start the game instead; --replay doesn't.)
+# =============================================================================
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+IMPORTS = {
+    "import dino": "import dino",
+    "import dino.strategies": "import dino.strategies",
+    "detect stage (numpy+cv2)": "import dino.detect",
+    "capture stage (mss)": "import dino.capture, mss",
+    "actuate stage (pyautogui)": "import pyautogui",
+    "old eager stack": "import numpy, cv2, mss, pyautogui",
+}
+
+OLD_FIXED_SLEEP_S = {"strip": 2.0, "better": 1.0, "even-better": 1.0, "plan": 1.0}  # plan: even-better's
+
+
+def time_import(stmt, runs):
+    """Best-of-runs import time in ms, or None if the import fails here."""
+    code = (
+        "import time; t0 = time.perf_counter(); "
+        + stmt
+        + "; print((time.perf_counter() - t0) * 1e3)"
+    )
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            return None
+        ms = float(proc.stdout.strip().splitlines()[-1])
+        best = ms if best is None else min(best, ms)
+    return best
+
+
+def time_startup(strategy, replay_dir, runs):
+    """Best-of-runs wall time (ms) from process start to one processed frame."""
+    cmd = [
+        sys.executable,
+        "-m",
+        "dino",
+        "--strategy",
+        strategy,
+        "--replay",
+        replay_dir,
+        "--dry-run",
+        "--headless",
+        "--max-frames",
+        "1",
+    ]
+    best = None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        proc = subprocess.run(cmd, cwd=HERE, capture_output=True, text=True)
+        ms = (time.perf_counter() - t0) * 1e3
+        if proc.returncode != 0:
+            print(proc.stderr)
+            return None
+        best = ms if best is None else min(best, ms)
+    return best
+
+
+def write_ready_frame(out_dir):
+    """One blank day-mode game frame (background + horizon) for the replay capture."""
+    import numpy as np
+    import cv2
+
+    frame = np.full((155, 600, 3), 247, np.uint8)
+    frame[121, :] = 83
+    cv2.imwrite(os.path.join(out_dir, "frame.png"), frame)
+
+
+def main():
+    p = argparse.ArgumentParser(description="Dino engine import/startup benchmark")
+    p.add_argument("--runs", type=int, default=5, help="Fresh interpreters per row")
+    p.add_argument(
+        "--max-import-ms",
+        type=float,
+        default=50.0,
+        help="Fail if `import dino` takes longer than this",
+    )
+    args = p.parse_args()
+
+    print(f"{'import':<28} {'ms':>8}")
+    results = {}
+    for name, stmt in IMPORTS.items():
+        ms = time_import(stmt, args.runs)
+        results[name] = ms
+        print(f"{name:<28} {'n/a' if ms is None else f'{ms:8.1f}':>8}")
+
+    print()
+    print(f"{'startup to 1st frame':<28} {'ms':>8} {'old sleep ms':>13}")
+    with tempfile.TemporaryDirectory() as replay_dir:
+        write_ready_frame(replay_dir)
+        for strategy, sleep_s in OLD_FIXED_SLEEP_S.items():
+            ms = time_startup(strategy, replay_dir, args.runs)
+            shown = "n/a" if ms is None else f"{ms:8.1f}"
+            print(f"{strategy:<28} {shown:>8} {sleep_s * 1e3:>13.0f}")
+
+    ms = results["import dino"]
+    if ms is None or ms > args.max_import_ms:
+        print(f"FAIL import dino: {ms} ms > {args.max_import_ms} ms")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())